@@ -1,3 +1,4 @@
+import functools
 import os
 from typing import Dict, Optional, Any, List, Callable
 import json
@@ -12,10 +13,22 @@ load_dotenv()
 class RealGeminiAgent:
     """실제 Google Gemini API 구현"""
     
-    def __init__(self, model="gemini-1.5-pro", temperature=0.1, **kwargs):
+    def __init__(self, model="gemini-1.5-pro", temperature=0.1, response_mime_type=None, **kwargs):
         self.model = model
         self.temperature = temperature
+        # "application/json"으로 지정하면 Gemini가 코드 블록이나 설명 없이 JSON 본문만 응답합니다
+        self.response_mime_type = response_mime_type
         self.kwargs = kwargs
+        
+        # 모델 구성 설정 (호출마다 동일하므로 한 번만 생성)
+        self.generation_config = {
+            "temperature": temperature,
+            "top_p": 0.95,
+            "top_k": 40,
+            "max_output_tokens": 8192,
+        }
+        if response_mime_type:
+            self.generation_config["response_mime_type"] = response_mime_type
         self.logger = logging.getLogger(__name__)
         
         # Google API 키 설정
@@ -41,18 +54,10 @@ class RealGeminiAgent:
             # Gemini 모델 생성
             model = genai.GenerativeModel(self.model)
             
-            # 모델 구성 설정
-            generation_config = {
-                "temperature": self.temperature,
-                "top_p": 0.95,
-                "top_k": 40,
-                "max_output_tokens": 8192,
-            }
-            
             # API 호출 및 응답 처리
             response = await model.generate_content_async(
                 input_text,
-                generation_config=generation_config
+                generation_config=self.generation_config
             )
             
             # 응답 텍스트 추출
@@ -73,7 +78,8 @@ class RealGeminiAgent:
             return {
                 "content": f"오류 발생: {str(e)}",
                 "model": self.model,
-                "temperature": self.temperature
+                "temperature": self.temperature,
+                "error": True
             }
     
     def invoke(self, prompt, **kwargs):
@@ -89,18 +95,10 @@ class RealGeminiAgent:
             # Gemini 모델 생성
             model = genai.GenerativeModel(self.model)
             
-            # 모델 구성 설정
-            generation_config = {
-                "temperature": self.temperature,
-                "top_p": 0.95,
-                "top_k": 40,
-                "max_output_tokens": 8192,
-            }
-            
             # API 호출 및 응답 처리
             response = model.generate_content(
                 input_text,
-                generation_config=generation_config
+                generation_config=self.generation_config
             )
             
             # 응답 텍스트 추출
@@ -121,17 +119,23 @@ class RealGeminiAgent:
             return {
                 "content": f"오류 발생: {str(e)}",
                 "model": self.model,
-                "temperature": self.temperature
+                "temperature": self.temperature,
+                "error": True
             }
 
 # 환경 설정
+# RealGeminiAgent는 호출 간 상태를 갖지 않으므로, get_gemini_agent를 functools.lru_cache로 감싸
+# (temperature, response_mime_type) 조합마다 프로세스당 한 번만 에이전트를 생성합니다.
+# 역할별 팩토리는 모두 get_gemini_agent에 위임하므로 별도로 캐시하지 않습니다.
 MODEL_NAME = os.getenv("GEMINI_MODEL", "gemini-1.5-pro")
 
-def get_gemini_agent(temperature: float = 0.3) -> RealGeminiAgent:
+@functools.lru_cache(maxsize=16)
+def get_gemini_agent(temperature: float = 0.3, response_mime_type: Optional[str] = None) -> RealGeminiAgent:
     """실제 Gemini AI 모델 에이전트를 생성합니다."""
     return RealGeminiAgent(
         model=MODEL_NAME, 
-        temperature=temperature
+        temperature=temperature,
+        response_mime_type=response_mime_type
     )
 
 def get_health_agent() -> RealGeminiAgent:
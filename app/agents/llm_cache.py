@@ -0,0 +1,101 @@
+"""
+LLM 응답 캐시 모듈
+동일한 프롬프트에 대한 에이전트 호출 결과를 일정 시간 동안 재사용합니다.
+"""
+
+import hashlib
+import logging
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# 캐시 최대 항목 수 (초과 시 가장 오래 사용되지 않은 항목부터 제거)
+MAX_CACHE_ENTRIES = 512
+
+class TTLCache:
+    """만료 시간이 있는 LRU 캐시 (단일 프로세스용)"""
+
+    def __init__(self, maxsize: int = MAX_CACHE_ENTRIES):
+        self.maxsize = maxsize
+        self._data: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """키에 해당하는 값을 반환합니다. 없거나 만료된 경우 None을 반환합니다."""
+        entry = self._data.get(key)
+        if entry is None:
+            return None
+
+        expires_at, value = entry
+        if expires_at < time.monotonic():
+            del self._data[key]
+            return None
+
+        self._data.move_to_end(key)
+        return value
+
+    def set(self, key: str, value: Dict[str, Any], ttl: float) -> None:
+        """값을 저장합니다."""
+        self._data[key] = (time.monotonic() + ttl, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def delete(self, key: str) -> None:
+        """키에 해당하는 항목을 제거합니다. 없으면 아무것도 하지 않습니다."""
+        self._data.pop(key, None)
+
+    def clear(self) -> None:
+        """모든 항목을 제거합니다."""
+        self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+# 프로세스 전역 응답 캐시
+_response_cache = TTLCache()
+
+def _cache_key(agent: Any, prompt: Any) -> str:
+    """에이전트 설정과 프롬프트로 캐시 키를 생성합니다."""
+    if isinstance(prompt, dict) and "input" in prompt:
+        prompt = prompt["input"]
+
+    model = getattr(agent, "model", "")
+    temperature = getattr(agent, "temperature", "")
+    mime_type = getattr(agent, "response_mime_type", None) or ""
+    raw = f"{model}\x00{temperature}\x00{mime_type}\x00{prompt}"
+    return hashlib.blake2b(raw.encode("utf-8"), digest_size=16).hexdigest()
+
+async def cached_invoke(agent: Any, prompt: Any, ttl: float = 3600) -> Dict[str, Any]:
+    """
+    에이전트를 호출하되, 같은 프롬프트의 최근 응답이 있으면 재사용합니다.
+
+    오류 응답은 캐시하지 않습니다.
+
+    Args:
+        agent: ainvoke를 제공하는 에이전트
+        prompt: 프롬프트 문자열 또는 {"input": ...} 딕셔너리
+        ttl: 캐시 유지 시간(초)
+
+    Returns:
+        Dict[str, Any]: 에이전트 응답
+    """
+    key = _cache_key(agent, prompt)
+
+    cached = _response_cache.get(key)
+    if cached is not None:
+        logger.info(f"[LLM_CACHE] 캐시 적중: {key}")
+        return dict(cached)
+
+    response = await agent.ainvoke(prompt)
+
+    if isinstance(response, dict) and "content" in response and not response.get("error"):
+        _response_cache.set(key, dict(response), ttl)
+        logger.debug(f"[LLM_CACHE] 응답 저장: {key} (항목 수: {len(_response_cache)})")
+
+    return response
+
+def clear_response_cache() -> None:
+    """응답 캐시를 비웁니다."""
+    _response_cache.clear()
@@ -14,10 +14,15 @@ from firebase_admin import credentials, messaging
 
 from app.models.health_data import HealthAssessment
 from app.main import HealthAIApplication
+from app.models._ids import new_id
 
 # 로깅 설정
 logger = logging.getLogger(__name__)
 
+# FCM 일괄 전송 설정 (send_each 최대 500건, 배치 대기 시간 50ms)
+FCM_BATCH_SIZE = 500
+FCM_BATCH_WINDOW_SECONDS = 0.05
+
 class AndroidServiceError(Exception):
     """안드로이드 서비스 오류"""
     pass
@@ -31,6 +36,8 @@ class AndroidCommunicationService:
         self.health_ai_app = health_ai_app or HealthAIApplication()
         self.firebase_app = None
         self.device_tokens = {}  # 사용자별 FCM 토큰 저장
+        self._send_queue: Optional[asyncio.Queue] = None  # 전송 대기 중인 (메시지, Future) 목록
+        self._batch_task: Optional[asyncio.Task] = None
         
         # Firebase 초기화 시도
         try:
@@ -395,36 +402,98 @@ class AndroidCommunicationService:
                 logger.warning("Firebase가 초기화되지 않아 알림을 전송할 수 없습니다.")
                 return False
             
-            # 알림 데이터 기본값 설정
-            notification_data = data or {}
-            notification_data.update({
-                "timestamp": datetime.now().isoformat(),
-                "notification_id": str(uuid.uuid4())
-            })
+            message = self._build_message(device_token, title, body, data, priority)
             
-            # FCM 메시지 생성
-            message = messaging.Message(
-                notification=messaging.Notification(
-                    title=title,
-                    body=body
-                ),
-                data=notification_data,
-                token=device_token,
-                android=messaging.AndroidConfig(
-                    priority="high" if priority == "high" else "normal",
-                    notification=messaging.AndroidNotification(
-                        icon="ic_stat_notification",
-                        color="#4285F4",
-                        channel_id="general_notifications" if priority != "high" else "health_alerts"
-                    )
+            # 전송 큐에 넣고 일괄 전송 결과를 기다림
+            return await self._enqueue_message(message)
+        except Exception as e:
+            logger.error(f"알림 전송 오류: {str(e)}")
+            return False 
+    
+    async def send_notifications_bulk(self, notifications: List[Dict[str, Any]]) -> List[bool]:
+        """
+        여러 사용자에게 푸시 알림을 일괄 전송합니다.
+        
+        각 항목은 send_notification의 인자(user_id, title, body, data, priority)를 담은 딕셔너리이며,
+        같은 배치 창에 들어온 메시지는 한 번의 FCM 호출로 전송됩니다.
+        """
+        return list(await asyncio.gather(
+            *(self.send_notification(**notification) for notification in notifications)
+        ))
+    
+    def _build_message(
+        self,
+        device_token: str,
+        title: str,
+        body: str,
+        data: Optional[Dict[str, Any]],
+        priority: str
+    ) -> "messaging.Message":
+        """FCM 메시지 생성"""
+        # 알림 데이터 기본값 설정
+        notification_data = data or {}
+        notification_data.update({
+            "timestamp": datetime.now().isoformat(),
+            "notification_id": new_id()
+        })
+        
+        return messaging.Message(
+            notification=messaging.Notification(
+                title=title,
+                body=body
+            ),
+            data=notification_data,
+            token=device_token,
+            android=messaging.AndroidConfig(
+                priority="high" if priority == "high" else "normal",
+                notification=messaging.AndroidNotification(
+                    icon="ic_stat_notification",
+                    color="#4285F4",
+                    channel_id="general_notifications" if priority != "high" else "health_alerts"
                 )
             )
+        )
+    
+    async def _enqueue_message(self, message: "messaging.Message") -> bool:
+        """메시지를 전송 큐에 넣고 전송 결과를 반환"""
+        if self._send_queue is None:
+            self._send_queue = asyncio.Queue()
+        if self._batch_task is None or self._batch_task.done():
+            self._batch_task = asyncio.create_task(self._run_batch_sender())
+        
+        future = asyncio.get_running_loop().create_future()
+        await self._send_queue.put((message, future))
+        return await future
+    
+    async def _run_batch_sender(self):
+        """큐에 쌓인 메시지를 배치 창 단위로 모아 전송"""
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._send_queue.get()]
+            deadline = loop.time() + FCM_BATCH_WINDOW_SECONDS
+            
+            while len(batch) < FCM_BATCH_SIZE:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._send_queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
             
-            # FCM으로 알림 전송
-            response = messaging.send(message)
-            logger.info(f"FCM 알림 전송 완료: {response}")
-            
-            return True
+            await self._dispatch_batch(batch)
+    
+    async def _dispatch_batch(self, batch: List[tuple]):
+        """메시지 배치를 한 번의 FCM 호출로 전송하고 각 Future에 결과 설정"""
+        messages = [message for message, _ in batch]
+        try:
+            response = await asyncio.to_thread(messaging.send_each, messages)
+            results = [item.success for item in response.responses]
+            logger.info(f"FCM 일괄 전송 완료: 성공 {response.success_count}건, 실패 {response.failure_count}건")
         except Exception as e:
-            logger.error(f"알림 전송 오류: {str(e)}")
-            return False 
\ No newline at end of file
+            logger.error(f"FCM 일괄 전송 오류: {str(e)}")
+            results = [False] * len(batch)
+        
+        for (_, future), success in zip(batch, results):
+            if not future.done():
+                future.set_result(success)
@@ -12,6 +12,7 @@ from datetime import datetime
 from app.models.user_data import UserResponse, SocialLoginRequest
 from app.models.api_models import ApiResponse
 from app.db.user_dao import UserDAO
+from app.nodes.exercise_nodes import invalidate_user_data_cache
 from app.auth.auth_handler import create_access_token, get_current_user
 from app.utils.api_utils import handle_api_error
 from app.config.settings import get_settings
@@ -76,6 +77,7 @@ async def social_login(login_request: SocialLoginRequest):
     소셜 로그인/회원가입 처리
     
     소셜 ID와 provider(kakao 또는 google)를 사용하여 소셜 로그인을 처리합니다.
+    지원하지 않는 provider는 요청 모델 검증에서 422로 거부됩니다.
     """
     async def _process_social_login():
         social_id = login_request.social_id
@@ -84,9 +86,6 @@ async def social_login(login_request: SocialLoginRequest):
         if not social_id:
             raise HTTPException(status_code=400, detail="소셜 ID가 제공되지 않았습니다.")
         
-        if provider not in ["kakao", "google"]:
-            raise HTTPException(status_code=400, detail="지원하지 않는 provider입니다. kakao 또는 google만 지원합니다.")
-        
         # 기존 소셜 계정 확인
         user = user_dao.get_social_account(social_id, provider)
         
@@ -139,6 +138,7 @@ async def update_health_metrics(height: Optional[float] = None, weight: Optional
             height=height,
             weight=weight
         )
+        invalidate_user_data_cache(current_user["user_id"])
         
         if not metrics_id:
             raise HTTPException(
@@ -213,6 +213,9 @@ async def update_user_profile(birth_date: Optional[str] = None, gender: Optional
             else:
                 logger.warning(f"사용자 {user_id}의 성별 업데이트 실패")
         
+        if updated_fields:
+            invalidate_user_data_cache(user_id)
+        
         # 응답 데이터 구성
         response_data = {
             "user_id": user_id,
@@ -253,6 +256,7 @@ async def delete_account(current_user=Depends(get_current_user)):
         
         # 사용자 계정 삭제 (관련된 모든 데이터는 CASCADE로 삭제됨)
         success = user_dao.delete_user(user_id)
+        invalidate_user_data_cache(user_id)
         
         if not success:
             raise HTTPException(
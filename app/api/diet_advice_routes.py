@@ -2,7 +2,7 @@
 식단 조언 관련 API 라우트
 """
 import logging
-import traceback
+import time
 from datetime import datetime
 from typing import Dict, Any, Optional, List
 import json
@@ -18,6 +18,7 @@ from app.models.api_models import ApiResponse
 from app.models.notification import UserState
 from app.models.diet_plan import DietAdviceRequest, FoodItem
 from app.graphs.diet_advice_graph import create_diet_advice_graph
+from app.nodes.exercise_nodes import invalidate_user_data_cache
 
 # 로깅 설정
 logging.basicConfig(
@@ -39,15 +40,15 @@ try:
     diet_advice_graph = create_diet_advice_graph()
     logger.info("[DIET_ROUTES] 식단 조언 그래프 인스턴스 생성 완료")
 except Exception as e:
-    logger.error(f"[DIET_ROUTES] 식단 조언 그래프 인스턴스 생성 오류: {str(e)}")
-    logger.error(f"[DIET_ROUTES] 오류 상세: {traceback.format_exc()}")
+    logger.exception("[DIET_ROUTES] 식단 조언 그래프 인스턴스 생성 오류: %s", e)
     raise
 
 @router.post("/advice", response_model=ApiResponse)
 async def get_diet_advice(request: DietAdviceRequest, user=Depends(get_current_user)):
     """식단 조언 요청"""
     logger.info(f"[DIET_ROUTES] 식단 조언 요청 시작 - 사용자 ID: {user['user_id']}, 요청 ID: {request.request_id}")
-    logger.debug(f"[DIET_ROUTES] 요청 데이터: {json.dumps(request.dict(), ensure_ascii=False, default=str)[:500]}...")
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("[DIET_ROUTES] 요청 데이터: %s...", json.dumps(request.dict(), ensure_ascii=False, default=str)[:500])
     
     async def _get_diet_advice():
         try:
@@ -67,16 +68,14 @@ async def get_diet_advice(request: DietAdviceRequest, user=Depends(get_current_u
             
             # 식단 조언 그래프 실행
             logger.info("[DIET_ROUTES] 식단 조언 그래프 실행 시작")
-            start_time = datetime.now()
+            start_time = time.perf_counter()
             
             try:
                 result = await diet_advice_graph.ainvoke(user_state)
-                end_time = datetime.now()
-                elapsed_time = (end_time - start_time).total_seconds()
+                elapsed_time = time.perf_counter() - start_time
                 logger.info(f"[DIET_ROUTES] 식단 조언 그래프 실행 완료 (소요시간: {elapsed_time:.2f}초)")
             except Exception as e:
-                logger.error(f"[DIET_ROUTES] 식단 조언 그래프 실행 오류: {str(e)}")
-                logger.error(f"[DIET_ROUTES] 오류 상세: {traceback.format_exc()}")
+                logger.exception("[DIET_ROUTES] 식단 조언 그래프 실행 오류: %s", e)
                 raise
             
             # 응답 데이터 준비
@@ -111,8 +110,8 @@ async def get_diet_advice(request: DietAdviceRequest, user=Depends(get_current_u
                     user_id=user["user_id"],
                     request_id=request.request_id,
                     meal_date=current_date,
-                    meal_type=meal["meal_type"],
-                    food_items=meal["food_items"],
+                    meal_type=meal.meal_type,
+                    food_items=[item.model_dump(exclude_none=True) for item in meal.food_items],
                     dietary_restrictions=request.dietary_restrictions,
                     health_goals=request.health_goals,
                     specific_concerns=request.specific_concerns,
@@ -120,18 +119,17 @@ async def get_diet_advice(request: DietAdviceRequest, user=Depends(get_current_u
                 )
                 
                 if success:
+                    invalidate_user_data_cache(user["user_id"])
                     logger.info(f"[DIET_ROUTES] 식단 조언 기록 저장 완료 - 사용자 ID: {user['user_id']}")
                 else:
                     logger.error(f"[DIET_ROUTES] 식단 조언 기록 저장 실패 - 사용자 ID: {user['user_id']}")
             except Exception as e:
-                logger.error(f"[DIET_ROUTES] 식단 조언 기록 저장 중 오류 발생: {str(e)}")
-                logger.error(f"[DIET_ROUTES] 오류 상세: {traceback.format_exc()}")
+                logger.exception("[DIET_ROUTES] 식단 조언 기록 저장 중 오류 발생: %s", e)
             
             return response_data
             
         except Exception as e:
-            logger.error(f"[DIET_ROUTES] 식단 조언 요청 오류: {str(e)}")
-            logger.error(f"[DIET_ROUTES] 오류 상세: {traceback.format_exc()}")
+            logger.exception("[DIET_ROUTES] 식단 조언 요청 오류: %s", e)
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 detail=f"식단 조언 요청 중 오류가 발생했습니다: {str(e)}"
@@ -181,8 +179,7 @@ async def get_diet_advice_history(
             return {"history": filtered_history}
             
         except Exception as e:
-            logger.error(f"[DIET_ROUTES] 식단 조언 히스토리 조회 오류: {str(e)}")
-            logger.error(f"[DIET_ROUTES] 오류 상세: {traceback.format_exc()}")
+            logger.exception("[DIET_ROUTES] 식단 조언 히스토리 조회 오류: %s", e)
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 detail=f"식단 조언 히스토리 조회 중 오류가 발생했습니다: {str(e)}"
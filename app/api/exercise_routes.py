@@ -1,6 +1,5 @@
 from typing import Dict, Any, List, Optional
 import logging
-from uuid import uuid4
 from datetime import datetime
 import json
 
@@ -8,14 +7,19 @@ from fastapi import APIRouter, HTTPException, Depends, Body, Query, Path
 from pydantic import BaseModel, Field
 
 from app.models.notification import UserState
-from app.models.exercise_data import ExerciseRecommendation, ExerciseCompletion
+from app.models.exercise_data import ExerciseRecommendation, ExerciseCompletion, ExercisePlan
+from app.models._ids import new_id
 from app.graphs.exercise_recommendation_graph import create_exercise_recommendation_graph
+from app.nodes.exercise_nodes import invalidate_user_data_cache
 from app.db.health_dao import HealthDAO
 from app.auth.auth_handler import get_current_user
 
 # 로거 설정
 logger = logging.getLogger(__name__)
 
+# 건강 DAO 인스턴스
+health_dao = HealthDAO()
+
 # 라우터 설정
 router = APIRouter(
     prefix="/api/v1/exercise",
@@ -44,7 +48,7 @@ class ExerciseRecommendationResponse(BaseModel):
     goal: str
     fitness_level: Optional[str] = None
     recommended_frequency: Optional[str] = None
-    exercise_plans: List[Dict[str, Any]] = []
+    exercise_plans: List[ExercisePlan] = []
     special_instructions: Optional[List[str]] = []
     recommendation_summary: str
     timestamp: datetime
@@ -184,8 +188,9 @@ async def get_exercise_recommendation(
         logger.info(f"[EXERCISE_API] 운동 추천 응답 준비 완료 - 추천 ID: {recommendation.recommendation_id}")
         
         # DB에 저장
-        health_dao = HealthDAO()
         save_success = health_dao.save_exercise_recommendation(recommendation)
+        # 다음 추천이 방금 저장한 추천을 이력으로 참고하도록 캐시 제거
+        invalidate_user_data_cache(user_id)
         
         if not save_success:
             logger.warning(f"[EXERCISE_API] 운동 추천 정보 DB 저장 실패: {recommendation.recommendation_id}")
@@ -230,7 +235,6 @@ async def get_user_exercise_recommendations(
         user_id = current_user["user_id"]
         logger.info(f"[EXERCISE_API] 사용자 운동 추천 이력 조회 요청 - 사용자 ID: {user_id}")
         
-        health_dao = HealthDAO()
         recommendations = health_dao.get_user_exercise_recommendations(user_id, limit)
         
         logger.info(f"[EXERCISE_API] 사용자 운동 추천 이력 조회 완료 - {len(recommendations)}개 결과")
@@ -277,7 +281,6 @@ async def get_specific_exercise_recommendation(
         user_id = current_user["user_id"]
         logger.info(f"[EXERCISE_API] 특정 운동 추천 조회 요청 - 사용자 ID: {user_id}, 추천 ID: {recommendation_id}")
         
-        health_dao = HealthDAO()
         recommendation = health_dao.get_exercise_recommendation(recommendation_id)
         
         if not recommendation:
@@ -331,8 +334,6 @@ async def record_exercise_completion(
         user_id = current_user["user_id"]
         logger.info(f"[EXERCISE_API] 운동 완료 기록 생성 요청 - 사용자 ID: {user_id}")
         
-        health_dao = HealthDAO()
-        
         recommendation = health_dao.get_exercise_recommendation(request.recommendation_id)
         
         if not recommendation:
@@ -346,7 +347,7 @@ async def record_exercise_completion(
         
         # 운동 완료 기록 생성
         completion = ExerciseCompletion(
-            completion_id=str(uuid4()),
+            completion_id=new_id(),
             recommendation_id=request.recommendation_id,
             user_id=user_id,
             completed_at=datetime.now(),
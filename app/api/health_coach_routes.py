@@ -2,11 +2,9 @@
 건강 코치 관련 API 라우트
 """
 import logging
-import traceback
-from datetime import datetime
+import time
 from typing import Dict, Any, Optional, List
 import json
-import uuid
 
 from fastapi import APIRouter, Depends, HTTPException, status
 from pydantic import BaseModel, Field
@@ -14,6 +12,7 @@ from pydantic import BaseModel, Field
 from app.db.health_dao import HealthDAO
 from app.auth.auth_handler import get_current_user
 from app.utils.api_utils import handle_api_error
+from app.models._ids import new_id
 from app.models.api_models import ApiResponse
 from app.models.notification import UserState
 from app.models.health_coach_data import HealthCoachRequest, HealthCoachResponse, WeeklyHealthReport, WeeklyReportRequest
@@ -39,8 +38,7 @@ try:
     health_coach_graph = create_health_coach_graph()
     logger.info("[HEALTH_COACH_ROUTES] 건강 코치 그래프 인스턴스 생성 완료")
 except Exception as e:
-    logger.error(f"[HEALTH_COACH_ROUTES] 건강 코치 그래프 인스턴스 생성 오류: {str(e)}")
-    logger.error(f"[HEALTH_COACH_ROUTES] 오류 상세: {traceback.format_exc()}")
+    logger.exception("[HEALTH_COACH_ROUTES] 건강 코치 그래프 인스턴스 생성 오류: %s", e)
     raise
 
 logger.info("[HEALTH_COACH_ROUTES] 주간 리포트 그래프 인스턴스 생성 시작")
@@ -48,13 +46,12 @@ try:
     weekly_report_graph = create_weekly_report_graph()
     logger.info("[HEALTH_COACH_ROUTES] 주간 리포트 그래프 인스턴스 생성 완료")
 except Exception as e:
-    logger.error(f"[HEALTH_COACH_ROUTES] 주간 리포트 그래프 인스턴스 생성 오류: {str(e)}")
-    logger.error(f"[HEALTH_COACH_ROUTES] 오류 상세: {traceback.format_exc()}")
+    logger.exception("[HEALTH_COACH_ROUTES] 주간 리포트 그래프 인스턴스 생성 오류: %s", e)
     raise
 
 # 요청 모델
 class WeeklyReportRequest(BaseModel):
-    request_id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    request_id: str = Field(default_factory=new_id)
     week_start_date: Optional[str] = None
     week_end_date: Optional[str] = None
 
@@ -62,7 +59,8 @@ class WeeklyReportRequest(BaseModel):
 async def get_health_coach_advice(request: HealthCoachRequest, user=Depends(get_current_user)):
     """건강 코치 조언 요청"""
     logger.info(f"[HEALTH_COACH_ROUTES] 건강 코치 조언 요청 시작 - 사용자 ID: {user['user_id']}, 요청 ID: {request.request_id}")
-    logger.debug(f"[HEALTH_COACH_ROUTES] 요청 데이터: {json.dumps(request.dict(), ensure_ascii=False, default=str)[:500]}...")
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("[HEALTH_COACH_ROUTES] 요청 데이터: %s...", json.dumps(request.dict(), ensure_ascii=False, default=str)[:500])
     
     async def _get_health_coach_advice():
         try:
@@ -82,16 +80,14 @@ async def get_health_coach_advice(request: HealthCoachRequest, user=Depends(get_
             
             # 건강 코치 그래프 실행
             logger.info("[HEALTH_COACH_ROUTES] 건강 코치 그래프 실행 시작")
-            start_time = datetime.now()
+            start_time = time.perf_counter()
             
             try:
                 result = await health_coach_graph.ainvoke(user_state)
-                end_time = datetime.now()
-                elapsed_time = (end_time - start_time).total_seconds()
+                elapsed_time = time.perf_counter() - start_time
                 logger.info(f"[HEALTH_COACH_ROUTES] 건강 코치 그래프 실행 완료 (소요시간: {elapsed_time:.2f}초)")
             except Exception as e:
-                logger.error(f"[HEALTH_COACH_ROUTES] 건강 코치 그래프 실행 오류: {str(e)}")
-                logger.error(f"[HEALTH_COACH_ROUTES] 오류 상세: {traceback.format_exc()}")
+                logger.exception("[HEALTH_COACH_ROUTES] 건강 코치 그래프 실행 오류: %s", e)
                 raise
             
             # 응답 데이터 준비
@@ -159,8 +155,7 @@ async def get_health_coach_advice(request: HealthCoachRequest, user=Depends(get_
             logger.info(f"[HEALTH_COACH_ROUTES] 건강 코치 조언 요청 처리 완료 - 요청 ID: {request.request_id}")
             return response_data
         except Exception as e:
-            logger.error(f"[HEALTH_COACH_ROUTES] 건강 코치 조언 요청 오류: {str(e)}")
-            logger.error(f"[HEALTH_COACH_ROUTES] 오류 상세: {traceback.format_exc()}")
+            logger.exception("[HEALTH_COACH_ROUTES] 건강 코치 조언 요청 오류: %s", e)
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 detail=f"건강 코치 조언 요청 중 오류가 발생했습니다: {str(e)}"
@@ -176,7 +171,8 @@ async def get_health_coach_advice(request: HealthCoachRequest, user=Depends(get_
 async def get_weekly_health_report(request: WeeklyReportRequest, user=Depends(get_current_user)):
     """주간 건강 리포트 요청"""
     logger.info(f"[HEALTH_COACH_ROUTES] 주간 건강 리포트 요청 시작 - 사용자 ID: {user['user_id']}, 요청 ID: {request.request_id}")
-    logger.debug(f"[HEALTH_COACH_ROUTES] 요청 데이터: {json.dumps(request.dict(), ensure_ascii=False, default=str)[:500]}...")
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("[HEALTH_COACH_ROUTES] 요청 데이터: %s...", json.dumps(request.dict(), ensure_ascii=False, default=str)[:500])
     
     async def _get_weekly_health_report():
         try:
@@ -196,16 +192,14 @@ async def get_weekly_health_report(request: WeeklyReportRequest, user=Depends(ge
             
             # 주간 리포트 그래프 실행
             logger.info("[HEALTH_COACH_ROUTES] 주간 리포트 그래프 실행 시작")
-            start_time = datetime.now()
+            start_time = time.perf_counter()
             
             try:
                 result = await weekly_report_graph.ainvoke(user_state)
-                end_time = datetime.now()
-                elapsed_time = (end_time - start_time).total_seconds()
+                elapsed_time = time.perf_counter() - start_time
                 logger.info(f"[HEALTH_COACH_ROUTES] 주간 리포트 그래프 실행 완료 (소요시간: {elapsed_time:.2f}초)")
             except Exception as e:
-                logger.error(f"[HEALTH_COACH_ROUTES] 주간 리포트 그래프 실행 오류: {str(e)}")
-                logger.error(f"[HEALTH_COACH_ROUTES] 오류 상세: {traceback.format_exc()}")
+                logger.exception("[HEALTH_COACH_ROUTES] 주간 리포트 그래프 실행 오류: %s", e)
                 raise
             
             # 응답 데이터 준비
@@ -282,8 +276,7 @@ async def get_weekly_health_report(request: WeeklyReportRequest, user=Depends(ge
             logger.info(f"[HEALTH_COACH_ROUTES] 주간 건강 리포트 요청 처리 완료 - 요청 ID: {request.request_id}")
             return response_data
         except Exception as e:
-            logger.error(f"[HEALTH_COACH_ROUTES] 주간 건강 리포트 요청 오류: {str(e)}")
-            logger.error(f"[HEALTH_COACH_ROUTES] 오류 상세: {traceback.format_exc()}")
+            logger.exception("[HEALTH_COACH_ROUTES] 주간 건강 리포트 요청 오류: %s", e)
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 detail=f"주간 건강 리포트 요청 중 오류가 발생했습니다: {str(e)}"
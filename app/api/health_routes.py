@@ -5,7 +5,6 @@ import os
 import logging
 from datetime import datetime
 from typing import Dict, Any, Optional, List
-import uuid
 
 from fastapi import APIRouter, Depends, HTTPException, status, Request, Body
 from fastapi.responses import JSONResponse
@@ -14,9 +13,11 @@ from pydantic import BaseModel, Field, validator
 from app.db.health_dao import HealthDAO
 from app.auth.auth_handler import get_current_user
 from app.nodes.health_check_nodes import analyze_health_metrics
+from app.nodes.exercise_nodes import invalidate_user_data_cache
 from app.utils.api_utils import handle_api_error  # 공통 에러 처리 함수 임포트
 from app.models.api_models import ApiResponse  # ApiResponse 모델 임포트
 from app.models.notification import UserState  # UserState 모델 임포트
+from app.models._ids import new_id
 
 # 로깅 설정
 logging.basicConfig(
@@ -91,6 +92,7 @@ async def add_health_metrics(metrics: HealthMetricsRequest, user=Depends(get_cur
     async def _add_health_metrics():
         metrics_dict = metrics.dict()
         metrics_id = health_dao.add_health_metrics(user["user_id"], metrics_dict)
+        invalidate_user_data_cache(user["user_id"])
         
         # 키와 체중이 있는 경우 BMI 계산 결과를 응답에 포함
         response_data = {"metrics_id": metrics_id}
@@ -169,6 +171,7 @@ async def add_dietary_restriction(restriction: DietaryRestrictionRequest, user=D
             restriction.is_active,
             restriction.notes
         )
+        invalidate_user_data_cache(user["user_id"])
         
         return ApiResponse(
             success=True,
@@ -306,7 +309,7 @@ async def get_latest_analysis(query: HealthQueryRequest, user=Depends(get_curren
             if profile.get("gemini_response"):
                 logger.info("기존 gemini_response 사용")
                 assessment_dict = {
-                    "assessment_id": str(uuid.uuid4()),
+                    "assessment_id": new_id(),
                     "timestamp": datetime.now().isoformat(),
                     "health_status": "분석 완료",
                     "concerns": [],
@@ -351,7 +354,7 @@ async def get_latest_analysis_get(query_text: Optional[str] = None, user=Depends
             if profile.get("gemini_response"):
                 logger.info("기존 gemini_response 사용")
                 assessment_dict = {
-                    "assessment_id": str(uuid.uuid4()),
+                    "assessment_id": new_id(),
                     "timestamp": datetime.now().isoformat(),
                     "health_status": "분석 완료",
                     "concerns": [],
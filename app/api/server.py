@@ -4,7 +4,6 @@
 
 import os
 import json
-import uuid
 import logging
 import asyncio
 from datetime import datetime, timedelta
@@ -20,6 +19,7 @@ from pydantic import BaseModel, Field
 # 앱 모듈 임포트
 from app.models.health_data import DietEntry, HealthMetrics, HealthAssessment
 from app.models.user_profile import UserProfile, UserGoal
+from app.models._ids import new_id
 from app.main import HealthAIApplication
 from app.api import auth_routes, health_routes, voice_routes, diet_advice_routes, health_coach_routes
 from app.api import exercise_routes  # exercise_routes 임포트 추가
@@ -29,6 +29,8 @@ from app.models.voice_models import VoiceQueryRequest, VoiceResponse, Consultati
 from app.models.health_data import HealthMetrics, HealthAssessment, DietEntry  # 실제 존재하는 클래스로 대체
 from app.models.user_data import UserProfile, UserResponse
 from app.models.notification import AndroidNotification  # NotificationSettings 대신 AndroidNotification 사용
+from app.models.registry import warm_up_models
+from app.agents.agent_config import get_diet_agent, get_diet_specialist_agent
 from app.config.settings import Settings
 from app.utils.conversation_manager import ConversationManager
 from app.utils.api_utils import handle_api_error  # api_utils에서 공통 함수 임포트
@@ -68,6 +70,17 @@ app.include_router(health_coach_routes.router, prefix="/api/v1/health/coach") #
 app.include_router(exercise_routes.router) # exercise_routes 추가 (prefix는 이미 라우터에 포함됨)
 app.include_router(app_routes.router, prefix="/api/v1/app") # app_routes 추가 (앱 버전 정보 등)
 
+@app.on_event("startup")
+async def prepare_model_validators():
+    """첫 요청 전에 모델 검증기 준비"""
+    warm_up_models()
+
+@app.on_event("startup")
+async def prepare_diet_agents():
+    """첫 식단 조언 요청 전에 라우터와 두 조언 노드가 사용하는 에이전트를 미리 생성"""
+    get_diet_agent()
+    get_diet_specialist_agent()
+
 # Health AI 애플리케이션 인스턴스
 health_ai_app = HealthAIApplication()
 
@@ -113,7 +126,7 @@ def get_user_session(user_id: str, create_if_missing: bool = True) -> Dict[str,
     """
     if user_id not in user_sessions and create_if_missing:
         user_sessions[user_id] = {
-            "session_id": str(uuid.uuid4()),
+            "session_id": new_id(),
             "created_at": datetime.now().isoformat(),
             "last_activity": datetime.now().isoformat(),
             "context": {}
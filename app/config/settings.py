@@ -65,6 +65,18 @@ class Settings(BaseSettings):
         description="기본 알림 우선순위"
     )
     
+    # 기록이 없는 사용자 추천 설정
+    LLM_COLD_START: bool = Field(
+        default=os.getenv("LLM_COLD_START", "true").lower() == "true",
+        description="식단/건강 기록이 없는 사용자에게도 LLM으로 추천을 생성할지 여부 (false면 기본 추천을 바로 반환)"
+    )
+    
+    # 식단 조언 라우팅 설정
+    DIET_SPECULATIVE_ROUTE: bool = Field(
+        default=os.getenv("DIET_SPECULATIVE_ROUTE", "false").lower() == "true",
+        description="라우팅 결정 중 두 조언 노드를 미리 실행할지 여부 (LLM 호출 비용 증가, 응답 지연 감소)"
+    )
+    
     # 데이터베이스 연결 설정
     DB_HOST: str = Field(
         default=os.getenv("DB_HOST", "localhost"), 
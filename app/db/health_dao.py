@@ -158,7 +158,7 @@ class HealthDAO:
                 
                 if latest_result and latest_result[column] is not None:
                     latest_metrics[column] = latest_result[column]
-                    logger.debug(f"컬럼 {column}의 최신 데이터 조회: {latest_result[column]} (날짜: {latest_result['timestamp']})")
+                    logger.debug("컬럼 %s의 최신 데이터 조회: %s (날짜: %s)", column, latest_result[column], latest_result['timestamp'])
                 
                 # 1년치 시계열 데이터 조회
                 time_series_query = f"""
@@ -202,26 +202,14 @@ class HealthDAO:
             # 시계열 데이터에 BMI 계산 추가
             time_series_metrics['bmi'] = []
             
-            # weight와 height의 시간별 데이터를 저장할 딕셔너리
-            weight_by_time = {}
-            height_by_time = {}
-            
             # weight와 height 데이터를 timestamp별로 정리
-            for weight_data in time_series_metrics['weight']:
-                weight_by_time[weight_data['timestamp']] = weight_data['value']
-            
-            for height_data in time_series_metrics['height']:
-                height_by_time[height_data['timestamp']] = height_data['value']
+            weight_by_time = {data['timestamp']: data['value'] for data in time_series_metrics['weight']}
+            height_by_time = {data['timestamp']: data['value'] for data in time_series_metrics['height']}
             
-            # 모든 타임스탬프 가져오기
-            all_timestamps = set(weight_by_time.keys()) | set(height_by_time.keys())
-            
-            # 각 타임스탬프에 대해 weight와 height 데이터가 모두 있는 경우 BMI 계산
-            for timestamp in all_timestamps:
-                if timestamp in weight_by_time and timestamp in height_by_time:
-                    weight = weight_by_time[timestamp]
-                    height = height_by_time[timestamp]
-                    
+            # 같은 타임스탬프에 weight와 height 데이터가 모두 있는 경우 BMI 계산
+            for timestamp, weight in weight_by_time.items():
+                height = height_by_time.get(timestamp)
+                if height is not None:
                     if height > 0:
                         height_m = height / 100.0
                         bmi = round(weight / (height_m * height_m), 1)
@@ -229,7 +217,7 @@ class HealthDAO:
                             'value': bmi,
                             'timestamp': timestamp
                         })
-                        logger.debug(f"시계열 BMI 계산: {timestamp}, BMI: {bmi}")
+                        logger.debug("시계열 BMI 계산: %s, BMI: %s", timestamp, bmi)
             
             # bmi 시계열 데이터를 시간 순으로 정렬
             time_series_metrics['bmi'].sort(key=lambda x: x['timestamp'])
@@ -554,7 +542,7 @@ class HealthDAO:
             logger.info(f"[HealthDAO] 운동 추천 정보 저장 시작: {recommendation.recommendation_id}")
             
             # JSON 필드 직렬화
-            exercise_plans_json = json.dumps(recommendation.exercise_plans, ensure_ascii=False)
+            exercise_plans_json = json.dumps([plan.model_dump() for plan in recommendation.exercise_plans], ensure_ascii=False)
             special_instructions_json = json.dumps(recommendation.special_instructions, ensure_ascii=False)
             available_equipment_json = json.dumps(recommendation.available_equipment, ensure_ascii=False)
             exercise_constraints_json = json.dumps(recommendation.exercise_constraints, ensure_ascii=False)
@@ -3,7 +3,6 @@
 """
 from typing import Annotated, Any, Dict, List
 import logging
-import traceback
 
 from langgraph.graph import StateGraph, END
 
@@ -40,7 +39,11 @@ def create_diet_advice_graph() -> StateGraph:
         
         # 라우팅 함수 정의
         def router(state):
-            logger.debug(f"[DIET_GRAPH] 라우팅 함수 호출: {state}")
+            logger.debug("[DIET_GRAPH] 라우팅 함수 호출: %s", state)
+            if "diet_response" in state:
+                # 라우팅 노드에서 미리 실행한 조언 결과가 있으면 바로 종료 (DIET_SPECULATIVE_ROUTE)
+                logger.debug("[DIET_GRAPH] 라우팅 노드에서 조언 생성 완료")
+                return "end"
             if "route" in state and state["route"] == "provide_diet_specialist_advice":
                 logger.debug("[DIET_GRAPH] 다이어트 전문가 조언으로 라우팅")
                 return "provide_diet_specialist_advice"
@@ -52,7 +55,8 @@ def create_diet_advice_graph() -> StateGraph:
         logger.debug("[DIET_GRAPH] 엣지 설정 시작")
         graph.add_conditional_edges("route_diet_request", router, {
             "provide_diet_advice": "provide_diet_advice",
-            "provide_diet_specialist_advice": "provide_diet_specialist_advice"
+            "provide_diet_specialist_advice": "provide_diet_specialist_advice",
+            "end": END
         })
         
         graph.add_edge("provide_diet_advice", END)
@@ -71,6 +75,5 @@ def create_diet_advice_graph() -> StateGraph:
         return compiled_graph
         
     except Exception as e:
-        logger.error(f"[DIET_GRAPH] 식단 조언 그래프 생성 중 오류 발생: {str(e)}")
-        logger.error(f"[DIET_GRAPH] 오류 상세: {traceback.format_exc()}")
+        logger.exception("[DIET_GRAPH] 식단 조언 그래프 생성 중 오류 발생: %s", e)
         raise 
\ No newline at end of file
@@ -1,6 +1,5 @@
 from typing import Annotated, Any, Dict, List, TypedDict
 import logging
-import traceback
 
 from langgraph.graph import StateGraph, END
 
@@ -51,6 +50,5 @@ def create_exercise_recommendation_graph() -> StateGraph:
         return compiled_graph
         
     except Exception as e:
-        logger.error(f"[EXERCISE_GRAPH] 운동 추천 그래프 생성 중 오류 발생: {str(e)}")
-        logger.error(f"[EXERCISE_GRAPH] 오류 상세: {traceback.format_exc()}")
+        logger.exception("[EXERCISE_GRAPH] 운동 추천 그래프 생성 중 오류 발생: %s", e)
         raise 
\ No newline at end of file
@@ -1,4 +1,5 @@
 from typing import Annotated, Any, Dict, List, TypedDict
+import logging
 
 from langgraph.graph import StateGraph, END
 
@@ -11,6 +12,8 @@ from app.nodes.health_check_nodes import (
     notify_doctor
 )
 
+logger = logging.getLogger(__name__)
+
 # 언패킹 오류 해결을 위한 래퍼 함수
 async def analyze_health_metrics_wrapper(state: UserState) -> HealthAssessment:
     """
@@ -23,8 +26,7 @@ async def analyze_health_metrics_wrapper(state: UserState) -> HealthAssessment:
             return result[0]
         return result
     except Exception as e:
-        import logging
-        logging.getLogger(__name__).error(f"랩퍼 함수 오류: {str(e)}")
+        logger.error(f"랩퍼 함수 오류: {str(e)}")
         raise e
 
 def create_health_metrics_graph() -> StateGraph:
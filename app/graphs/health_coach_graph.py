@@ -1,6 +1,5 @@
 from typing import Annotated, Any, Dict, List
 import logging
-import traceback
 
 from langgraph.graph import StateGraph, END
 
@@ -44,8 +43,7 @@ def create_health_coach_graph() -> StateGraph:
         return compiled_graph
         
     except Exception as e:
-        logger.error(f"[HEALTH_COACH_GRAPH] 건강 코치 조언 그래프 생성 중 오류 발생: {str(e)}")
-        logger.error(f"[HEALTH_COACH_GRAPH] 오류 상세: {traceback.format_exc()}")
+        logger.exception("[HEALTH_COACH_GRAPH] 건강 코치 조언 그래프 생성 중 오류 발생: %s", e)
         raise
 
 def create_weekly_report_graph() -> StateGraph:
@@ -81,6 +79,5 @@ def create_weekly_report_graph() -> StateGraph:
         return compiled_graph
         
     except Exception as e:
-        logger.error(f"[HEALTH_COACH_GRAPH] 주간 건강 리포트 그래프 생성 중 오류 발생: {str(e)}")
-        logger.error(f"[HEALTH_COACH_GRAPH] 오류 상세: {traceback.format_exc()}")
+        logger.exception("[HEALTH_COACH_GRAPH] 주간 건강 리포트 그래프 생성 중 오류 발생: %s", e)
         raise 
\ No newline at end of file
@@ -1,4 +1,5 @@
 from typing import Annotated, Any, Dict, List
+import logging
 
 from langgraph.graph import StateGraph, END
 
@@ -10,6 +11,8 @@ from app.nodes.voice_consultation_nodes import (
     create_voice_segments
 )
 
+logger = logging.getLogger(__name__)
+
 def create_voice_query_graph() -> StateGraph:
     """
     음성 질의 처리를 위한 LangGraph 생성
@@ -25,9 +28,6 @@ def create_voice_query_graph() -> StateGraph:
     # create_voice_segments 노드는 process_voice_query의 반환값을 받을 수 있도록 설정
     async def create_voice_segments_wrapper(state, config=None, last_response=None):
         """create_voice_segments 함수를 래핑하여 last_response 매개변수를 전달"""
-        import logging
-        logger = logging.getLogger(__name__)
-        
         # 더 자세한 로깅
         logger.info(f"create_voice_segments_wrapper 호출 - last_response 존재: {last_response is not None}")
         
@@ -90,11 +90,8 @@ def create_voice_query_graph() -> StateGraph:
     # create_voice_segments에서 이를 사용하도록 라우팅합니다.
     def route_to_voice_segments(state: UserState) -> str:
         """라우팅 함수"""
-        import logging
-        logger = logging.getLogger(__name__)
-        
         # 디버깅을 위한 상태 객체 검사
-        logger.debug(f"라우팅: 상태 객체 속성: {dir(state)}")
+        logger.debug("라우팅: 상태 객체 속성: %s", dir(state))
         
         # 상태 변수에서 last_response 확인
         if hasattr(state, 'last_response') and state.last_response is not None:
@@ -104,7 +101,7 @@ def create_voice_query_graph() -> StateGraph:
         else:
             logger.warning(f"라우팅: state.last_response가 없거나 None 값임")
             # 상태 객체 디버깅 정보
-            logger.debug(f"상태 객체 속성: {dir(state)}")
+            logger.debug("상태 객체 속성: %s", dir(state))
         
         # 항상 create_voice_segments로 이동
         return "create_voice_segments"
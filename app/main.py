@@ -6,9 +6,9 @@ from dotenv import load_dotenv
 import logfire
 import logging
 import base64
-import uuid
 
 from app.models.user_profile import UserProfile, UserGoal, HealthMetrics
+from app.models._ids import new_id
 from app.models.health_data import SymptomReport, HealthAssessment, DietEntry
 from app.models.diet_plan import MealRecommendation, FoodImageData
 from app.models.notification import UserState, AndroidNotification, VoiceResponse
@@ -69,7 +69,6 @@ class HealthAIApplication:
             current_metrics=HealthMetrics(
                 weight=82.5,
                 height=178.0,
-                bmi=26.0,
                 body_fat_percentage=25.0,
                 blood_pressure={"systolic": 130, "diastolic": 85},
                 heart_rate=72,
@@ -122,7 +121,7 @@ class HealthAIApplication:
             raise ValueError("이미지 데이터가 필요합니다")
         
         # 이미지 ID 생성 및 기본 데이터 설정
-        image_id = str(uuid.uuid4())
+        image_id = new_id()
         user_id = self.current_user.user_id
         
         # FoodImageData 객체 생성 (필요시)
@@ -154,8 +153,8 @@ class HealthAIApplication:
         else:
             self.logger.warning("이미지 분석에서 식단 정보를 추출할 수 없습니다")
             # 기본 DietEntry 생성 (실제 구현에서는 더 적절한 처리 필요)
-            meal_id = str(uuid.uuid4())
-            entry_id = str(uuid.uuid4())
+            meal_id = new_id()
+            entry_id = new_id()
             return DietEntry(
                 meal_id=meal_id,
                 entry_id=entry_id,
@@ -280,9 +279,7 @@ class HealthAIApplication:
             return response
             
         except Exception as e:
-            self.logger.error(f"음성 질의 처리 중 오류 발생: {str(e)}")
-            import traceback
-            self.logger.error(traceback.format_exc())
+            self.logger.exception("음성 질의 처리 중 오류 발생: %s", e)
             return [f"죄송합니다. 음성 질의 처리 중 오류가 발생했습니다: {str(e)}"]
             
     async def process_health_query(self, query_text: str, user_id: str = None) -> List[str]:
@@ -365,9 +362,7 @@ class HealthAIApplication:
             return ["건강 상담을 완료했습니다. 특별한 건강 이슈는 발견되지 않았습니다. 정기적인 건강 체크를 권장합니다."]
             
         except Exception as e:
-            self.logger.error(f"건강 상담 쿼리 처리 중 오류 발생: {str(e)}")
-            import traceback
-            self.logger.error(traceback.format_exc())
+            self.logger.exception("건강 상담 쿼리 처리 중 오류 발생: %s", e)
             return [f"죄송합니다. 건강 상담 처리 중 오류가 발생했습니다: {str(e)}"]
     
     async def conduct_health_consultation(self, progress_data: Dict) -> List[str]:
@@ -614,26 +609,16 @@ async def main():
         "recent_activities": ["매일 걷기 30분", "식단 조절", "수면 개선"]
     }
     
-    # 건강 체크 테스트
-    await app.check_health_metrics()
-    
-    # 식단 분석 테스트
-    await app.analyze_diet(sample_meals)
-    
-    # 식품 이미지 분석 테스트
-    await app.analyze_food_image(sample_image_data)
-    
-    # 증상 분석 테스트
-    await app.analyze_symptoms(sample_symptoms)
-    
-    # 음성 질의 테스트
-    await app.process_voice_query("매일 할 수 있는 간단한 운동 추천해줘")
-    
-    # 건강 상담 테스트
-    await app.process_health_query("건강 상담 쿼리 테스트")
-    
-    # 동기부여 알림 테스트
-    await app.send_motivational_notification(sample_progress)
+    # 각 시나리오는 별도의 사용자 상태로 실행되므로 LLM 호출을 동시에 진행합니다
+    await asyncio.gather(
+        app.check_health_metrics(),                                  # 건강 체크 테스트
+        app.analyze_diet(sample_meals),                              # 식단 분석 테스트
+        app.analyze_food_image(sample_image_data),                   # 식품 이미지 분석 테스트
+        app.analyze_symptoms(sample_symptoms),                       # 증상 분석 테스트
+        app.process_voice_query("매일 할 수 있는 간단한 운동 추천해줘"),  # 음성 질의 테스트
+        app.process_health_query("건강 상담 쿼리 테스트"),               # 건강 상담 테스트
+        app.send_motivational_notification(sample_progress),         # 동기부여 알림 테스트
+    )
 
 if __name__ == "__main__":
     asyncio.run(main())
@@ -0,0 +1,16 @@
+"""
+모델 식별자 생성 유틸리티
+"""
+
+from uuid import uuid4
+
+def new_id() -> str:
+    """
+    새 식별자를 생성합니다.
+
+    UUID 문자열 변환(하이픈 삽입) 없이 16진수 문자열을 그대로 사용합니다.
+
+    Returns:
+        str: 32자리 16진수 식별자
+    """
+    return uuid4().hex
@@ -1,7 +1,11 @@
-from pydantic import BaseModel, Field
-from typing import List, Dict, Optional, Any
+from functools import cached_property
+
+from pydantic import BaseModel, Field, computed_field
+from typing import List, Dict, Optional
 from datetime import date, datetime
-from uuid import uuid4
+
+from app.models._ids import new_id
+from app.models.enums import MealType
 
 class FoodItem(BaseModel):
     """음식 항목 모델"""
@@ -13,7 +17,7 @@ class FoodItem(BaseModel):
     fat: Optional[float] = None
     
 class Meal(BaseModel):
-    meal_type: str  # "아침", "점심", "저녁", "간식"
+    meal_type: MealType
     food_items: List[FoodItem]
     total_calories: float
     nutrition_breakdown: Dict[str, float]  # {"단백질": 25.0, "탄수화물": 50.0, "지방": 15.0}
@@ -30,11 +34,20 @@ class DietPlan(BaseModel):
     created_at: datetime
     updated_at: Optional[datetime] = None
     
+    class Config:
+        frozen = True
+    
+    @computed_field
+    @cached_property
+    def total_weekly_calories(self) -> float:
+        """기간 전체 식사의 총 칼로리 (인스턴스당 한 번 계산)"""
+        return sum(meal.total_calories for meals in self.daily_meals.values() for meal in meals)
+    
 class DietEntry(BaseModel):
     """식단 기록 모델"""
-    entry_id: str = str(uuid4())
+    entry_id: str = Field(default_factory=new_id)
     user_id: Optional[str] = None
-    timestamp: datetime = datetime.now()
+    timestamp: datetime = Field(default_factory=datetime.now)
     meal_type: str  # 아침, 점심, 저녁, 간식 등
     food_items: List[FoodItem]
     total_calories: float
@@ -43,56 +56,67 @@ class DietEntry(BaseModel):
     
 class MealRecommendation(BaseModel):
     """식사 추천 모델"""
-    recommendation_id: str = str(uuid4())
+    recommendation_id: str = Field(default_factory=new_id)
     user_id: Optional[str] = None
-    timestamp: datetime = datetime.now()
+    timestamp: datetime = Field(default_factory=datetime.now)
     meal_type: str
-    food_items: List[Dict[str, Any]]
+    food_items: List[FoodItem]
     total_calories: float
     nutrients: Dict[str, float]
     description: str
     
 class FoodImageData(BaseModel):
     """음식 이미지 데이터 모델"""
-    image_id: str = str(uuid4())
+    image_id: str = Field(default_factory=new_id)
     user_id: str
     meal_type: str
     image_data: str  # Base64 인코딩된 이미지 데이터
-    timestamp: datetime = datetime.now()
+    timestamp: datetime = Field(default_factory=datetime.now)
     
 class FoodImageRecognitionResult(BaseModel):
     """음식 이미지 인식 결과 모델"""
-    recognition_id: str = str(uuid4())
+    recognition_id: str = Field(default_factory=new_id)
     image_id: str
-    timestamp: datetime = datetime.now()
+    timestamp: datetime = Field(default_factory=datetime.now)
     recognized_foods: List[Dict[str, float]]  # 음식 이름과 확률
     confidence_score: float
     
 class FoodNutritionAnalysis(BaseModel):
     """음식 영양소 분석 모델"""
-    analysis_id: str = str(uuid4())
+    analysis_id: str = Field(default_factory=new_id)
     recognition_id: str
-    timestamp: datetime = datetime.now()
+    timestamp: datetime = Field(default_factory=datetime.now)
     recognized_foods: List[FoodItem]
     estimated_total_calories: float
     estimated_nutrition: Dict[str, float]  # 단백질, 탄수화물, 지방 등
     nutrition_percentage: Dict[str, float]  # 영양소 비율 (%)
     meal_quality_score: float  # 1-10 점수
     
+class MealFoodItem(BaseModel):
+    """식사에 포함된 음식 항목 모델 (칼로리는 선택)"""
+    name: str
+    amount: str = "1인분"
+    calories: Optional[float] = None
+
+class DietAdviceMeal(BaseModel):
+    """식단 조언 요청에 포함된 식사 모델"""
+    meal_type: str = "식사"
+    food_items: List[MealFoodItem] = []
+
 class DietAdviceRequest(BaseModel):
     """식단 조언 요청 모델"""
     request_id: str = Field(default_factory=lambda: datetime.now().strftime("%Y%m%d%H%M%S"))
     user_id: str
-    current_diet: List[Dict[str, Any]]
+    current_diet: List[DietAdviceMeal]
     dietary_restrictions: Optional[List[str]] = None
     health_goals: Optional[List[str]] = None
     specific_concerns: Optional[str] = None
     
 class DietSpecialistResponse(BaseModel):
     """다이어트 전문 조언 응답 모델"""
-    response_id: str = str(uuid4())
+    response_id: str = Field(default_factory=new_id)
     request_id: str
-    timestamp: datetime = datetime.now()
+    timestamp: datetime = Field(default_factory=datetime.now)
     advice: str  # 모든 다이어트 조언을 포함하는 단일 필드
 
 class DietAnalysis(BaseModel):
@@ -0,0 +1,51 @@
+"""
+공통 범주형 값 열거형 정의
+몇 가지 값만 허용되는 문자열 필드를 열거형으로 고정합니다.
+"""
+
+from enum import StrEnum
+
+class SocialProvider(StrEnum):
+    """소셜 로그인 제공자 열거형"""
+    KAKAO = "kakao"
+    GOOGLE = "google"
+
+class NotificationPriority(StrEnum):
+    """알림 우선순위 열거형"""
+    HIGH = "high"
+    NORMAL = "normal"
+    LOW = "low"
+
+class VoiceType(StrEnum):
+    """음성 유형 열거형"""
+    MALE = "male"
+    FEMALE = "female"
+
+class SegmentType(StrEnum):
+    """음성 세그먼트 유형 열거형"""
+    GREETING = "greeting"
+    QUESTION = "question"
+    RESPONSE = "response"
+    FOLLOW_UP = "follow_up"
+    CONCLUSION = "conclusion"
+    CLOSING = "closing"
+    ERROR = "error"
+
+class MealType(StrEnum):
+    """식사 유형 열거형"""
+    BREAKFAST = "아침"
+    LUNCH = "점심"
+    DINNER = "저녁"
+    SNACK = "간식"
+
+class Intensity(StrEnum):
+    """운동 강도 열거형"""
+    LOW = "낮음"
+    MEDIUM = "중간"
+    HIGH = "높음"
+
+class GoalStatus(StrEnum):
+    """건강 목표 진행 상태 열거형"""
+    IN_PROGRESS = "진행 중"
+    ACHIEVED = "달성"
+    ABANDONED = "포기"
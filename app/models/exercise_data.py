@@ -1,14 +1,23 @@
 from pydantic import BaseModel, Field
-from typing import List, Dict, Optional, Any
+from typing import List, Optional
 from datetime import datetime, date, time
-from uuid import uuid4
+
+from app.models._ids import new_id
+
+class ExercisePlan(BaseModel):
+    """개별 운동 계획 모델"""
+    name: str = ""  # 운동명
+    description: str = ""  # 운동 방법 설명
+    duration: str = ""  # 권장 시간 (예: 30분)
+    benefits: Optional[str] = None  # 운동 효과
+    youtube_link: Optional[str] = None  # 유튜브 검색 링크
 
 class ExerciseRecommendation(BaseModel):
     """운동 추천 정보 모델"""
-    recommendation_id: str = str(uuid4())
+    recommendation_id: str = Field(default_factory=new_id)
     user_id: str
     goal: str  # 근력 강화, 유산소, 체중 감량, 유연성 향상 등
-    exercise_plans: List[Dict[str, Any]] = []  # [{"name": "운동명", "description": "설명", "duration": "30분", "youtube_link": "URL"}]
+    exercise_plans: List[ExercisePlan] = []
     fitness_level: Optional[str] = None  # 초보자, 중급자, 고급자
     recommended_frequency: Optional[str] = None  # 주 3회, 매일 등
     special_instructions: Optional[List[str]] = []  # 특별 지시사항
@@ -28,7 +37,7 @@ class ExerciseRecommendation(BaseModel):
 
 class ExerciseCompletion(BaseModel):
     """운동 완료 기록 모델"""
-    completion_id: str = str(uuid4())
+    completion_id: str = Field(default_factory=new_id)
     recommendation_id: str
     user_id: str
     completed_at: datetime = Field(default_factory=datetime.now)
@@ -1,21 +1,23 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 from typing import List, Dict, Optional, Any
 from datetime import datetime
-from uuid import uuid4
+
+from app.models._ids import new_id
+from app.models.enums import GoalStatus
 
 class HealthCoachRequest(BaseModel):
     """건강 코치 요청 모델"""
-    request_id: str = str(uuid4())
+    request_id: str = Field(default_factory=new_id)
     user_id: str
     query: str
-    timestamp: datetime = datetime.now()
+    timestamp: datetime = Field(default_factory=datetime.now)
     context: Optional[Dict[str, Any]] = None
 
 class HealthCoachResponse(BaseModel):
     """건강 코치 응답 모델"""
-    response_id: str = str(uuid4())
+    response_id: str = Field(default_factory=new_id)
     request_id: str
-    timestamp: datetime = datetime.now()
+    timestamp: datetime = Field(default_factory=datetime.now)
     advice: str
     recommendations: List[str]
     explanation: str
@@ -24,19 +26,19 @@ class HealthCoachResponse(BaseModel):
 
 class HealthGoal(BaseModel):
     """건강 목표 모델"""
-    goal_id: str = str(uuid4())
+    goal_id: str = Field(default_factory=new_id)
     user_id: str
     goal_type: str  # 체중 감량, 근육 증가, 건강 개선 등
     target_value: Optional[float] = None
     current_value: Optional[float] = None
-    start_date: datetime = datetime.now()
+    start_date: datetime = Field(default_factory=datetime.now)
     target_date: Optional[datetime] = None
     progress: float = 0.0  # 0.0 ~ 1.0
-    status: str = "진행 중"  # 진행 중, 달성, 포기 등
+    status: GoalStatus = GoalStatus.IN_PROGRESS
     
 class WeeklyHealthReport(BaseModel):
     """주간 건강 리포트 모델"""
-    report_id: str = str(uuid4())
+    report_id: str = Field(default_factory=new_id)
     user_id: str
     start_date: datetime
     end_date: datetime
@@ -49,11 +51,11 @@ class WeeklyHealthReport(BaseModel):
 
 class WeeklyReportRequest(BaseModel):
     """주간 건강 리포트 요청 모델"""
-    request_id: str = str(uuid4())
+    request_id: str = Field(default_factory=new_id)
     user_id: str
     start_date: Optional[datetime] = None
     end_date: Optional[datetime] = None
     include_metrics: bool = True
     include_activities: bool = True
     include_diet: bool = True
-    timestamp: datetime = datetime.now() 
\ No newline at end of file
+    timestamp: datetime = Field(default_factory=datetime.now) 
\ No newline at end of file
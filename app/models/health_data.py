@@ -2,6 +2,10 @@ from pydantic import BaseModel
 from typing import List, Dict, Optional, Any, Union
 from datetime import datetime, date
 
+from app.models.user_profile import BloodPressure, UserGoal
+from app.models.voice_data import VoiceSegment
+from app.models.enums import Intensity
+
 class SymptomReport(BaseModel):
     symptom_name: str
     severity: int  # 1-10 척도
@@ -15,7 +19,7 @@ class MedicationIntake(BaseModel):
     
 class HealthMetrics(BaseModel):
     heart_rate: Optional[int] = None
-    blood_pressure: Optional[Dict[str, int]] = None  # {"systolic": 120, "diastolic": 80}
+    blood_pressure: Optional[BloodPressure] = None
     blood_sugar: Optional[float] = None
     temperature: Optional[float] = None
     oxygen_saturation: Optional[int] = None
@@ -70,7 +74,7 @@ class ExerciseRecord(BaseModel):
     duration_minutes: int
     calories_burned: float
     timestamp: datetime
-    intensity: str  # "낮음", "중간", "높음"
+    intensity: Intensity
     notes: Optional[str] = None
     
     class Config:
@@ -81,7 +85,7 @@ class UserProfile(BaseModel):
     name: str
     birth_date: date
     gender: str
-    goals: List[Dict[str, Any]] = []
+    goals: List[UserGoal] = []
     current_metrics: Dict[str, Any] = {}
     metrics_history: List[Dict[str, Any]] = []
     dietary_restrictions: List[str] = []
@@ -90,12 +94,3 @@ class UserProfile(BaseModel):
     
     class Config:
         arbitrary_types_allowed = True
-
-class VoiceSegment(BaseModel):
-    segment_id: str
-    content: str
-    segment_type: str  # "greeting", "question", "response", "follow_up", "conclusion"
-    timestamp: datetime
-    
-    class Config:
-        arbitrary_types_allowed = True 
\ No newline at end of file
@@ -1,22 +1,27 @@
+from dataclasses import dataclass, field
+
 from pydantic import BaseModel
 from typing import List, Dict, Optional, Any
 from datetime import datetime
 
+from app.models.enums import NotificationPriority, VoiceType
 from app.models.voice_data import VoiceSegment
 
 class AndroidNotification(BaseModel):
     title: str
     body: str
-    priority: str = "normal"  # "high", "normal", "low"
+    priority: NotificationPriority = NotificationPriority.NORMAL
     data: Optional[Dict[str, Any]] = None
     channel_id: str = "health_ai_channel"
     
 class VoiceResponse(BaseModel):
     text: str
-    voice_type: str = "female"  # "male", "female"
+    voice_type: VoiceType = VoiceType.FEMALE
     speech_speed: float = 1.0
     
-class NotificationResult(BaseModel):
+@dataclass(slots=True)
+class NotificationResult:
+    """알림 전송 결과 (내부 전용, 검증 없음)"""
     notification_id: str
     timestamp: datetime
     status: str
@@ -31,19 +36,27 @@ class ConsultationSummary(BaseModel):
     recommendations: List[str]
     followup_needed: bool = False
     
-class UserState(BaseModel):
+@dataclass(slots=True, kw_only=True)
+class UserState:
+    """
+    그래프 실행 중에만 사용되는 내부 상태 객체
+    API 경계를 넘지 않으므로 검증 없는 슬롯 데이터클래스로 정의합니다.
+    """
     user_profile: Dict[str, Any]
     user_id: Optional[str] = None
     query_text: Optional[str] = None
-    voice_scripts: List[str] = []
-    notifications: List[AndroidNotification] = []
+    voice_scripts: List[str] = field(default_factory=list)
+    notifications: List[AndroidNotification] = field(default_factory=list)
     current_notification: Optional[AndroidNotification] = None
     voice_input: Optional[str] = None
     voice_data: Optional[Dict[str, Any]] = None
-    voice_segments: List[VoiceSegment] = []
+    voice_segments: List[VoiceSegment] = field(default_factory=list)
     recent_meals: Optional[Dict[str, Any]] = None
     progress_data: Optional[Dict[str, Any]] = None
     diet_analysis: Optional[Any] = None
+    diet_entry: Optional[Any] = None
+    nutrition_analysis: Optional[Any] = None
+    recognition_result: Optional[Any] = None
     health_assessment: Optional[Any] = None
     health_metrics: Optional[Dict[str, Any]] = None
     symptoms: Optional[List[Dict[str, Any]]] = None
@@ -53,8 +66,6 @@ class UserState(BaseModel):
     diet_specialist_response: Optional[Any] = None
     health_coach_request: Optional[Dict[str, Any]] = None
     health_coach_response: Optional[Any] = None
+    weekly_report_request: Optional[Dict[str, Any]] = None
     weekly_health_report: Optional[Any] = None
     exercise_recommendation: Optional[Any] = None
-    
-    class Config:
-        arbitrary_types_allowed = True 
\ No newline at end of file
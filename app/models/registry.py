@@ -0,0 +1,71 @@
+"""
+모델 검증기 사전 준비 모듈
+API 경계를 오가는 모델들의 검증기를 서버 시작 시 한 번 준비해 둡니다.
+"""
+
+import functools
+import logging
+from typing import Tuple, Type
+
+from pydantic import BaseModel, ValidationError
+
+from app.models.api_models import ApiResponse
+from app.models.app_data import AppVersionInfo
+from app.models.diet_plan import DietAdviceRequest, DietEntry, FoodItem, MealRecommendation
+from app.models.exercise_data import ExerciseCompletion, ExerciseRecommendation
+from app.models.health_coach_data import HealthCoachRequest, HealthCoachResponse, WeeklyReportRequest
+from app.models.health_data import HealthAssessment, HealthMetrics
+from app.models.notification import AndroidNotification
+from app.models.user_data import HealthMetricsUpdate, SocialLoginRequest, UserProfile, UserResponse
+from app.models.voice_models import ConsultationRequest, VoiceQueryRequest, VoiceResponse
+
+logger = logging.getLogger(__name__)
+
+# 요청/응답 경로에서 사용되는 모델 목록
+API_MODELS: Tuple[Type[BaseModel], ...] = (
+    ApiResponse,
+    AppVersionInfo,
+    DietAdviceRequest,
+    DietEntry,
+    FoodItem,
+    MealRecommendation,
+    ExerciseRecommendation,
+    ExerciseCompletion,
+    HealthCoachRequest,
+    HealthCoachResponse,
+    WeeklyReportRequest,
+    HealthMetrics,
+    HealthAssessment,
+    AndroidNotification,
+    SocialLoginRequest,
+    UserProfile,
+    UserResponse,
+    HealthMetricsUpdate,
+    VoiceQueryRequest,
+    VoiceResponse,
+    ConsultationRequest,
+)
+
+@functools.cache
+def warm_up_models() -> int:
+    """
+    모델 검증기를 미리 준비합니다.
+
+    model_rebuild()로 스키마가 완성되었는지 확인하고, 빈 JSON을 한 번 검증하여
+    첫 실제 요청이 JSON 검증 경로 초기화 비용을 부담하지 않도록 합니다.
+    프로세스당 한 번만 실행됩니다.
+
+    Returns:
+        int: 준비된 모델 수
+    """
+    for model in API_MODELS:
+        # 미완성 스키마(해결되지 않은 참조)가 있으면 여기서 예외가 발생합니다
+        model.model_rebuild()
+        try:
+            model.model_validate_json(b"{}")
+        except ValidationError:
+            # 필수 필드 누락은 예상된 결과입니다
+            pass
+
+    logger.info(f"모델 검증기 준비 완료: {len(API_MODELS)}개")
+    return len(API_MODELS)
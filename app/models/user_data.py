@@ -6,13 +6,15 @@ from pydantic import BaseModel, Field
 from typing import Dict, Any, Optional, List, Literal
 from datetime import datetime
 
+from app.models.enums import SocialProvider
+
 class SocialLoginRequest(BaseModel):
     """
     안드로이드 앱에서 소셜 로그인 요청 모델
     앱에서 이미 소셜 인증이 완료된 후 서버로 전송되는 정보
     """
     social_id: str  # 소셜 ID (카카오 ID 또는 구글 ID)
-    provider: str = "kakao"  # 제공자 (kakao 또는 google)
+    provider: SocialProvider = SocialProvider.KAKAO  # 제공자 (kakao 또는 google)
     
     class Config:
         schema_extra = {
@@ -26,7 +28,7 @@ class UserProfile(BaseModel):
     """사용자 프로필 모델"""
     user_id: str
     social_id: str
-    provider: str = "kakao"
+    provider: SocialProvider = SocialProvider.KAKAO
     birth_date: Optional[str] = None
     gender: Optional[str] = None
     height: Optional[float] = None
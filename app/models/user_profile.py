@@ -1,21 +1,55 @@
-from pydantic import BaseModel
+from functools import cached_property
+
+from pydantic import BaseModel, Field, computed_field
 from typing import List, Dict, Optional, Any
 from datetime import date, datetime
 
+from app.models.enums import VoiceType
+
 class UserGoal(BaseModel):
     goal_type: str  # "체중감량", "근육증가", "건강유지" 등
     target_value: float
     deadline: Optional[date] = None
     
+class BloodPressure(BaseModel):
+    """혈압 모델 (mmHg)"""
+    systolic: int
+    diastolic: int
+    
+    class Config:
+        frozen = True
+    
+class VoicePreference(BaseModel):
+    """음성 안내 설정 모델"""
+    voice_type: VoiceType = VoiceType.FEMALE
+    speech_speed: float = 1.0
+    
+class NotificationPreferences(BaseModel):
+    """알림 설정 모델"""
+    android_device_id: str = ""
+    notification_time: List[str] = Field(default_factory=list)
+    voice_preference: VoicePreference = Field(default_factory=VoicePreference)
+    
 class HealthMetrics(BaseModel):
     weight: float
-    height: float
-    bmi: float
+    height: float  # 키(cm)
     body_fat_percentage: Optional[float] = None
-    blood_pressure: Optional[Dict[str, float]] = None  # {"systolic": 120, "diastolic": 80}
+    blood_pressure: Optional[BloodPressure] = None
     heart_rate: Optional[int] = None
     sleep_hours: Optional[float] = None
     
+    class Config:
+        frozen = True
+    
+    @computed_field
+    @cached_property
+    def bmi(self) -> Optional[float]:
+        """체중과 키로 계산한 BMI (인스턴스당 한 번 계산, 키가 0 이하면 None)"""
+        if self.height <= 0:
+            return None
+        height_m = self.height / 100
+        return round(self.weight / (height_m * height_m), 1)
+    
 class UserProfile(BaseModel):
     user_id: str
     name: str
@@ -26,14 +60,7 @@ class UserProfile(BaseModel):
     metrics_history: List[Dict[str, Any]] = []
     dietary_restrictions: List[str] = []
     medical_conditions: List[str] = []
-    notification_preferences: Dict[str, Any] = {
-        "android_device_id": "",
-        "notification_time": [],
-        "voice_preference": {
-            "voice_type": "female",
-            "speech_speed": 1.0
-        }
-    }
+    notification_preferences: NotificationPreferences = Field(default_factory=NotificationPreferences)
     
     class Config:
         arbitrary_types_allowed = True 
\ No newline at end of file
@@ -1,7 +1,9 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 from typing import List, Dict, Optional, Any
 from datetime import datetime
 
+from app.models.enums import SegmentType
+
 class VoiceQuery(BaseModel):
     query_id: str
     timestamp: datetime
@@ -38,8 +40,9 @@ class ConsultationSummary(BaseModel):
 class VoiceSegment(BaseModel):
     segment_id: str
     text: str
-    duration_seconds: float
-    segment_type: str  # "greeting", "response", "closing" 등
+    segment_type: SegmentType
+    duration_seconds: float = 0.0
+    timestamp: datetime = Field(default_factory=datetime.now)
     
     class Config:
         arbitrary_types_allowed = True 
\ No newline at end of file
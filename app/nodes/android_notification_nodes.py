@@ -1,17 +1,70 @@
 from typing import Dict, Any, List
-from uuid import uuid4
 from datetime import datetime
 import logging
 import os
 
 from langgraph.graph import END
 
+from app.models.enums import NotificationPriority
 from app.models.notification import UserState, AndroidNotification, NotificationResult
+from app.models._ids import new_id
 from app.agents.agent_config import get_notification_agent
+from app.agents.llm_cache import cached_invoke
+from app.utils.llm_json import parse_agent_json
 
 # 로거 설정
 logger = logging.getLogger(__name__)
 
+# 응답 파싱 실패 시 사용할 기본 알림 내용
+_NOTIFICATION_FALLBACK = {
+    "title": "건강 관리 알림",
+    "body": "오늘도 건강한 하루를 위해 목표를 확인해보세요.",
+    "priority": "normal"
+}
+
+# 알림 생성 프롬프트의 고정 부분 (사용자 정보는 호출 시 뒤에 붙입니다)
+_SCHEDULED_NOTIFICATION_PROMPT_PREFIX = """
+아래 사용자를 위해 지정된 유형의 예약 알림을 생성해주세요.
+
+알림 제목과 내용을 생성해주세요. 내용은 간결하고 동기부여가 되어야 합니다.
+
+JSON 형식으로 다음 정보를 포함하여 응답해주세요:
+{
+    "title": "알림 제목",
+    "body": "알림 내용",
+    "priority": "normal"
+}
+"""
+
+_MOTIVATIONAL_NOTIFICATION_PROMPT_PREFIX = """
+아래 사용자를 위한 동기부여 알림을 생성해주세요.
+
+동기부여가 되는 알림 제목과 내용을 생성해주세요. 내용은 간결하고 긍정적이어야 합니다.
+
+JSON 형식으로 다음 정보를 포함하여 응답해주세요:
+{
+    "title": "알림 제목",
+    "body": "알림 내용",
+    "priority": "normal"
+}
+"""
+
+def _parse_priority(value: Any) -> NotificationPriority:
+    """LLM이 응답한 우선순위를 열거형으로 변환합니다. 허용되지 않는 값은 NORMAL로 처리합니다."""
+    priority = str(value).strip().lower()
+    if priority in NotificationPriority._value2member_map_:
+        return NotificationPriority(priority)
+    logger.warning(f"알 수 없는 알림 우선순위: {value} - normal로 처리")
+    return NotificationPriority.NORMAL
+
+def _display_name(user_profile: Dict[str, Any]) -> str:
+    """사용자 표시 이름을 반환합니다. 한 번 만든 이름은 프로필에 저장해 재사용합니다."""
+    display_name = user_profile.get("_display_name")
+    if display_name is None:
+        display_name = f"{user_profile.get('first_name', '')} {user_profile.get('last_name', '')}".strip()
+        user_profile["_display_name"] = display_name
+    return display_name
+
 async def send_android_notification(state: UserState) -> NotificationResult:
     logger.info("안드로이드 알림 전송 시작")
     
@@ -20,7 +73,7 @@ async def send_android_notification(state: UserState) -> NotificationResult:
     if not notification:
         logger.warning("전송할 알림이 없습니다")
         return END(NotificationResult(
-            notification_id=str(uuid4()),
+            notification_id=new_id(),
             timestamp=datetime.now(),
             status="failed",
             message="전송할 알림이 없습니다."
@@ -35,7 +88,7 @@ async def send_android_notification(state: UserState) -> NotificationResult:
     if not device_token:
         logger.warning(f"사용자 기기 토큰이 없습니다 - 사용자 ID: {user_id}")
         return END(NotificationResult(
-            notification_id=str(uuid4()),
+            notification_id=new_id(),
             timestamp=datetime.now(),
             status="failed",
             message="사용자 기기 토큰이 없습니다."
@@ -46,7 +99,7 @@ async def send_android_notification(state: UserState) -> NotificationResult:
     
     # 결과 생성
     result = NotificationResult(
-        notification_id=str(uuid4()),
+        notification_id=new_id(),
         timestamp=datetime.now(),
         status="success",
         message="알림이 성공적으로 전송되었습니다."
@@ -63,10 +116,10 @@ async def schedule_notification(state: UserState, schedule_data: Dict[str, Any])
     
     if not schedule_time:
         logger.warning("스케줄 시간이 지정되지 않았습니다")
-        return END(AndroidNotification(
+        return END(AndroidNotification.model_construct(
             title="스케줄링 오류",
             body="알림 스케줄링에 필요한 시간 정보가 없습니다.",
-            priority="normal"
+            priority=NotificationPriority.NORMAL
         ))
     
     # 알림 에이전트 생성
@@ -74,58 +127,32 @@ async def schedule_notification(state: UserState, schedule_data: Dict[str, Any])
     
     # 사용자 정보 준비
     user_profile = state.user_profile
-    user_name = f"{user_profile.get('first_name', '')} {user_profile.get('last_name', '')}"
-    
-    # 알림 내용 생성 요청
-    prompt = f"""
-    다음 사용자를 위한 {notification_type} 알림을 생성해주세요:
-    
-    사용자 정보:
-    - 이름: {user_name}
-    - 나이: {user_profile.get('age', '알 수 없음')}
-    - 성별: {user_profile.get('gender', '알 수 없음')}
-    
-    알림 유형: {notification_type}
-    예약 시간: {schedule_time}
+    user_name = _display_name(user_profile)
     
-    알림 제목과 내용을 생성해주세요. 내용은 간결하고 동기부여가 되어야 합니다.
-    
-    JSON 형식으로 다음 정보를 포함하여 응답해주세요:
-    {{
-        "title": "알림 제목",
-        "body": "알림 내용",
-        "priority": "normal 또는 high"
-    }}
-    """
+    # 알림 내용 생성 요청 (고정 지시문 뒤에 사용자별 정보를 붙입니다)
+    prompt = _SCHEDULED_NOTIFICATION_PROMPT_PREFIX + f"""
+알림 유형: {notification_type}
+예약 시간: {schedule_time}
+
+사용자 정보:
+- 이름: {user_name}
+- 나이: {user_profile.get('age', '알 수 없음')}
+- 성별: {user_profile.get('gender', '알 수 없음')}
+"""
     
     # 에이전트 실행 및 결과 파싱
-    result = await agent.ainvoke({"input": prompt})
-    
-    # AIMessage 객체에서 content 추출
-    if hasattr(result, 'content'):
-        output = result.content
-    else:
-        output = str(result)
+    result = await cached_invoke(agent, {"input": prompt})
     
-    # JSON 문자열 추출 및 파싱
-    import json
-    import re
-    
-    json_match = re.search(r'```json\s*(.*?)\s*```', output, re.DOTALL)
-    if json_match:
-        json_str = json_match.group(1)
-    else:
-        json_str = re.search(r'{.*}', output, re.DOTALL).group(0)
-    
-    data = json.loads(json_str)
+    # JSON 추출 및 파싱 (누락된 항목은 기본 알림 값으로 채움)
+    data = {**_NOTIFICATION_FALLBACK, **parse_agent_json(result, _NOTIFICATION_FALLBACK)}
     
     logger.info(f"알림 생성 완료 - 제목: {data['title']}")
     
-    # 알림 생성
+    # 알림 생성 (LLM 응답 값이므로 검증을 거칩니다)
     notification = AndroidNotification(
         title=data["title"],
         body=data["body"],
-        priority=data["priority"]
+        priority=_parse_priority(data["priority"])
     )
     
     # 알림 저장
@@ -142,7 +169,7 @@ async def create_motivational_notification(state: UserState) -> AndroidNotificat
     
     # 사용자 정보 준비
     user_profile = state.user_profile
-    user_name = f"{user_profile.get('first_name', '')} {user_profile.get('last_name', '')}"
+    user_name = _display_name(user_profile)
     
     # 사용자 목표 정보 준비
     goals = user_profile.get("goals", [])
@@ -154,54 +181,28 @@ async def create_motivational_notification(state: UserState) -> AndroidNotificat
     recent_activities = progress.get("recent_activities", []) if progress else []
     activities_str = "없음" if not recent_activities else ", ".join(recent_activities[:3])
     
-    # 알림 내용 생성 요청
-    prompt = f"""
-    다음 사용자를 위한 동기부여 알림을 생성해주세요:
-    
-    사용자 정보:
-    - 이름: {user_name}
-    - 목표: {goal_str}
-    - 현재 진행률: {progress_percentage}%
-    - 최근 활동: {activities_str}
-    
-    동기부여가 되는 알림 제목과 내용을 생성해주세요. 내용은 간결하고 긍정적이어야 합니다.
-    
-    JSON 형식으로 다음 정보를 포함하여 응답해주세요:
-    {{
-        "title": "알림 제목",
-        "body": "알림 내용",
-        "priority": "normal"
-    }}
-    """
+    # 알림 내용 생성 요청 (고정 지시문 뒤에 사용자별 정보를 붙입니다)
+    prompt = _MOTIVATIONAL_NOTIFICATION_PROMPT_PREFIX + f"""
+사용자 정보:
+- 이름: {user_name}
+- 목표: {goal_str}
+- 현재 진행률: {progress_percentage}%
+- 최근 활동: {activities_str}
+"""
     
     # 에이전트 실행 및 결과 파싱
-    result = await agent.ainvoke({"input": prompt})
-    
-    # AIMessage 객체에서 content 추출
-    if hasattr(result, 'content'):
-        output = result.content
-    else:
-        output = str(result)
-    
-    # JSON 문자열 추출 및 파싱
-    import json
-    import re
-    
-    json_match = re.search(r'```json\s*(.*?)\s*```', output, re.DOTALL)
-    if json_match:
-        json_str = json_match.group(1)
-    else:
-        json_str = re.search(r'{.*}', output, re.DOTALL).group(0)
+    result = await cached_invoke(agent, {"input": prompt})
     
-    data = json.loads(json_str)
+    # JSON 추출 및 파싱 (누락된 항목은 기본 알림 값으로 채움)
+    data = {**_NOTIFICATION_FALLBACK, **parse_agent_json(result, _NOTIFICATION_FALLBACK)}
     
     logger.info(f"동기부여 알림 생성 완료 - 제목: {data['title']}")
     
-    # 알림 생성
+    # 알림 생성 (LLM 응답 값이므로 검증을 거칩니다)
     notification = AndroidNotification(
         title=data["title"],
         body=data["body"],
-        priority=data["priority"]
+        priority=_parse_priority(data["priority"])
     )
     
     # 알림 저장
@@ -1,18 +1,81 @@
 from typing import Dict, Any, List
-from uuid import uuid4
 from datetime import datetime, timedelta
 import logging
 
 from langgraph.graph import END
+from pydantic import TypeAdapter
 
 from app.models.health_data import DietAnalysis, DietEntry
 from app.models.diet_plan import MealRecommendation, FoodItem
 from app.models.notification import UserState, AndroidNotification
+from app.models._ids import new_id
 from app.agents.agent_config import get_diet_agent
+from app.agents.llm_cache import cached_invoke
+from app.config.settings import get_settings
+from app.utils.llm_json import extract_json_str, get_agent_content, loads_json
 
 # 로거 설정
 logger = logging.getLogger(__name__)
 
+settings = get_settings()
+
+# 식단 분석/추천 응답 캐시 유지 시간(초) - 같은 식단과 목표로 다시 요청하면 LLM 호출을 생략
+_DIET_RESPONSE_TTL = 6 * 3600
+
+# 시각(0-23시)별 다음 식사 - 10시 전 아침, 14시 전 점심, 18시 전 저녁, 이후 간식
+_NEXT_MEAL_BY_HOUR = tuple(
+    "아침" if hour < 10 else "점심" if hour < 14 else "저녁" if hour < 18 else "간식"
+    for hour in range(24)
+)
+
+# 다음 식사별 목표 칼로리 (체중감량 목표 / 그 외)
+_WEIGHT_LOSS_TARGET_CALORIES = {"아침": 400, "점심": 600, "저녁": 500, "간식": 200}
+_DEFAULT_TARGET_CALORIES = {"아침": 600, "점심": 800, "저녁": 700, "간식": 300}
+
+# 보충이 필요하다고 판단하는 영양소별 최소 비율 (프롬프트에 넣는 순서)
+_NUTRIENT_MIN_RATIOS = (("단백질", 0.25), ("탄수화물", 0.45), ("지방", 0.2))
+
+# LLM 응답의 음식 항목 목록 검증기 (모듈 로드 시 한 번만 생성)
+_FOOD_ITEMS_ADAPTER = TypeAdapter(List[FoodItem])
+
+# 식단 분석 프롬프트 템플릿 (str.format으로 채웁니다)
+_DIET_ANALYSIS_PROMPT = """
+    다음 사용자의 식단을 분석하고 영양 균형을 평가해주세요:
+    
+    사용자 정보:
+    - 건강 목표: {goal_str}
+    - 식이 제한: {restrictions_str}
+    
+    오늘의 식단:
+    {meals_data}
+    
+    분석 결과를 제공해주세요:
+    1. 총 섭취 칼로리
+    2. 영양소 균형 (단백질, 탄수화물, 지방의 비율)
+    3. 개선 제안 (3가지)
+    
+    다음 형식의 JSON으로만 응답해주세요:
+    {{"calories": 숫자, "nutrition_balance": {{"단백질": 소수점, "탄수화물": 소수점, "지방": 소수점}}, "suggestions": ["개선 제안 1", "개선 제안 2", "개선 제안 3"]}}
+    """
+
+# 다음 식사 추천 프롬프트 템플릿 (str.format으로 채웁니다)
+_MEAL_RECOMMENDATION_PROMPT = """
+    사용자를 위한 다음 식사({next_meal}) 추천을 해주세요.
+    
+    사용자 정보:
+    - 식이 제한: {dietary_restrictions}
+    - 보충이 필요한 영양소: {nutrient_focus_str}
+    - 목표 칼로리: {target_calories}kcal
+    
+    오늘의 현재 섭취 상황:
+    - 총 섭취 칼로리: {calories_consumed}kcal
+    - 영양소 균형: 단백질 {protein_pct:.1f}%, 탄수화물 {carbs_pct:.1f}%, 지방 {fat_pct:.1f}%
+    
+    추천 음식 목록(이름, 양, 칼로리, 단백질/탄수화물/지방 g), 영양소 구성 비율, 추천 이유를
+    다음 형식의 JSON으로만 응답해주세요:
+    {{"meal_type": "{next_meal}", "food_items": [{{"name": "음식1", "amount": "100g", "calories": 150, "protein": 10, "carbs": 20, "fat": 5}}], "total_calories": 150, "nutrients": {{"단백질": 0.3, "탄수화물": 0.5, "지방": 0.2}}, "description": "추천 이유"}}
+    """
+
 async def analyze_diet(state: UserState) -> DietAnalysis:
     # 사용자의 식단 정보 분석
     logger.info(f"식단 분석 시작 - 사용자 ID: {state.user_profile.get('user_id', 'unknown')}")
@@ -30,11 +93,11 @@ async def analyze_diet(state: UserState) -> DietAnalysis:
     agent = get_diet_agent()
     
     # 사용자 식단 데이터 준비
-    meals_data = "\n".join([
-        f"- {meal.get('meal_type')}: " + 
-        ", ".join([f"{food.get('name')} ({food.get('amount', '1개')})" for food in meal.get('food_items', [])])
+    meals_data = "\n".join(
+        f"- {meal.get('meal_type')}: "
+        + ", ".join(f"{food.get('name')} ({food.get('amount', '1개')})" for food in meal.get('food_items', []))
         for meal in recent_meals.get('meals', [])
-    ])
+    )
     
     user_goals = state.user_profile.get("goals", [])
     goal_str = "특별한 목표 없음" if not user_goals else f"{user_goals[0].get('goal_type')} (목표값: {user_goals[0].get('target_value')})"
@@ -43,49 +106,22 @@ async def analyze_diet(state: UserState) -> DietAnalysis:
     restrictions_str = "없음" if not dietary_restrictions else ", ".join(dietary_restrictions)
     
     # AI에게 식단 분석 요청
-    prompt = f"""
-    다음 사용자의 식단을 분석하고 영양 균형을 평가해주세요:
-    
-    사용자 정보:
-    - 건강 목표: {goal_str}
-    - 식이 제한: {restrictions_str}
-    
-    오늘의 식단:
-    {meals_data}
-    
-    분석 결과를 제공해주세요:
-    1. 총 섭취 칼로리
-    2. 영양소 균형 (단백질, 탄수화물, 지방의 비율)
-    3. 개선 제안 (3가지)
-    
-    JSON 형식으로 다음 정보를 포함하여 응답해주세요:
-    {{
-        "calories": 숫자,
-        "nutrition_balance": {{"단백질": 소수점, "탄수화물": 소수점, "지방": 소수점}},
-        "suggestions": ["개선 제안 1", "개선 제안 2", "개선 제안 3"]
-    }}
-    """
+    prompt = _DIET_ANALYSIS_PROMPT.format(
+        goal_str=goal_str,
+        restrictions_str=restrictions_str,
+        meals_data=meals_data,
+    )
     
     # 에이전트 실행 및 결과 파싱
-    result = await agent.ainvoke({"input": prompt})
+    result = await cached_invoke(agent, {"input": prompt}, ttl=_DIET_RESPONSE_TTL)
     
-    # AIMessage 객체에서 content 추출
-    if hasattr(result, 'content'):
-        output = result.content
-    else:
-        output = str(result)
+    # 에이전트 응답에서 텍스트 추출 ({"content": ...} 딕셔너리 또는 AIMessage)
+    output = get_agent_content(result)
     
     # JSON 문자열 추출 및 파싱
-    import json
-    import re
+    json_str = extract_json_str(output) or output
     
-    json_match = re.search(r'```json\s*(.*?)\s*```', output, re.DOTALL)
-    if json_match:
-        json_str = json_match.group(1)
-    else:
-        json_str = re.search(r'{.*}', output, re.DOTALL).group(0)
-    
-    data = json.loads(json_str)
+    data = loads_json(json_str)
     
     logger.info(f"식단 분석 완료 - 칼로리: {data['calories']}")
     
@@ -105,149 +141,95 @@ async def analyze_diet(state: UserState) -> DietAnalysis:
     
     return analysis
 
+def _empty_meal_recommendation(meal_type: str, description: str) -> MealRecommendation:
+    """LLM 호출 없이 반환하는 빈 식사 추천을 생성합니다."""
+    return MealRecommendation(
+        meal_type=meal_type,
+        food_items=[],
+        total_calories=0,
+        nutrients={"단백질": 0.0, "탄수화물": 0.0, "지방": 0.0},
+        description=description
+    )
+
 async def provide_recommendations(state: UserState) -> MealRecommendation:
     # 상태에서 분석 결과 가져오기
     analysis = state.diet_analysis
     if not analysis:
         logger.warning("식단 분석 결과가 없습니다")
-        return MealRecommendation(
-            recommendation_id=str(uuid4()),
-            timestamp=datetime.now(),
-            meal_type="간식",
-            food_items=[],
-            total_calories=0,
-            nutrition_breakdown={"단백질": 0.0, "탄수화물": 0.0, "지방": 0.0},
-            reasoning="식단 분석 결과가 없어 추천할 수 없습니다."
-        )
+        return _empty_meal_recommendation("간식", "식단 분석 결과가 없어 추천할 수 없습니다.")
     
     logger.info(f"식단 추천 시작 - 칼로리: {analysis.calories_consumed}")
     
-    # 식단 추천 에이전트 생성
-    agent = get_diet_agent()
-    
     user_profile = state.user_profile
     dietary_restrictions = user_profile.get("dietary_restrictions", [])
     goals = user_profile.get("goals", [])
     
     # 다음 식사 시간 결정 (현재 시간 기준)
-    now = datetime.now()
-    hour = now.hour
-    
-    if hour < 10:
-        next_meal = "아침"
-    elif hour < 14:
-        next_meal = "점심"
-    elif hour < 18:
-        next_meal = "저녁"
-    else:
-        next_meal = "간식"
+    next_meal = _NEXT_MEAL_BY_HOUR[datetime.now().hour]
     
     # 목표 칼로리 계산 (간단한 예시)
     if goals and goals[0].get("goal_type") == "체중감량":
-        target_calories = 400 if next_meal == "아침" else 600 if next_meal == "점심" else 500 if next_meal == "저녁" else 200
+        target_calories = _WEIGHT_LOSS_TARGET_CALORIES[next_meal]
     else:
-        target_calories = 600 if next_meal == "아침" else 800 if next_meal == "점심" else 700 if next_meal == "저녁" else 300
+        target_calories = _DEFAULT_TARGET_CALORIES[next_meal]
     
     # 영양 균형 계산
     current_balance = analysis.nutrition_balance
-    needs_more_protein = current_balance.get("단백질", 0) < 0.25
-    needs_more_carbs = current_balance.get("탄수화물", 0) < 0.45
-    needs_more_fat = current_balance.get("지방", 0) < 0.2
-    
-    nutrient_focus = []
-    if needs_more_protein:
-        nutrient_focus.append("단백질")
-    if needs_more_carbs:
-        nutrient_focus.append("탄수화물")
-    if needs_more_fat:
-        nutrient_focus.append("지방")
+    nutrient_focus = [
+        nutrient for nutrient, min_ratio in _NUTRIENT_MIN_RATIOS
+        if current_balance.get(nutrient, 0) < min_ratio
+    ]
     
     nutrient_focus_str = ", ".join(nutrient_focus) if nutrient_focus else "균형잡힌 영양소"
     
-    # 식단 추천 요청
-    prompt = f"""
-    사용자를 위한 다음 식사({next_meal}) 추천을 해주세요.
+    # 섭취 기록이 없는 사용자는 설정에 따라 LLM 호출 없이 기본 안내 반환
+    if analysis.calories_consumed == 0 and not settings.LLM_COLD_START:
+        logger.info("식단 추천 생략 - 섭취 기록 없음")
+        return _empty_meal_recommendation(
+            next_meal,
+            f"오늘 기록된 식단이 없습니다. 식단을 기록하면 {next_meal} 맞춤 추천(목표 {target_calories}kcal)을 받을 수 있습니다."
+        )
     
-    사용자 정보:
-    - 식이 제한: {', '.join(dietary_restrictions) if dietary_restrictions else '없음'}
-    - 보충이 필요한 영양소: {nutrient_focus_str}
-    - 목표 칼로리: {target_calories}kcal
+    # 식단 추천 에이전트 생성
+    agent = get_diet_agent()
     
-    오늘의 현재 섭취 상황:
-    - 총 섭취 칼로리: {analysis.calories_consumed}kcal
-    - 영양소 균형: 단백질 {current_balance.get('단백질', 0)*100:.1f}%, 탄수화물 {current_balance.get('탄수화물', 0)*100:.1f}%, 지방 {current_balance.get('지방', 0)*100:.1f}%
-    
-    다음 정보를 JSON 형식으로 제공해주세요:
-    1. 추천 음식 목록 (이름, 양, 예상 칼로리)
-    2. 이 식사의 영양소 구성
-    3. 식사 설명 및 추천 이유
-    
-    JSON 예시:
-    {
-        "meal_items": [
-            {"name": "음식1", "amount": "100g", "calories": 150},
-            {"name": "음식2", "amount": "1인분", "calories": 200}
-        ],
-        "nutrients": {"단백질": 0.3, "탄수화물": 0.5, "지방": 0.2},
-        "description": "이 식단을 추천한 이유에 대한 설명"
-    }
-    """
+    # 식단 추천 요청
+    prompt = _MEAL_RECOMMENDATION_PROMPT.format(
+        next_meal=next_meal,
+        dietary_restrictions=', '.join(dietary_restrictions) if dietary_restrictions else '없음',
+        nutrient_focus_str=nutrient_focus_str,
+        target_calories=target_calories,
+        calories_consumed=analysis.calories_consumed,
+        protein_pct=current_balance.get('단백질', 0) * 100,
+        carbs_pct=current_balance.get('탄수화물', 0) * 100,
+        fat_pct=current_balance.get('지방', 0) * 100,
+    )
     
     # 에이전트 호출 및 결과 처리
-    result = await agent.ainvoke({"input": prompt})
+    result = await cached_invoke(agent, {"input": prompt}, ttl=_DIET_RESPONSE_TTL)
     
-    # AIMessage 객체에서 content 추출
-    if hasattr(result, 'content'):
-        output = result.content
-    else:
-        output = str(result)
+    # 에이전트 응답에서 텍스트 추출 ({"content": ...} 딕셔너리 또는 AIMessage)
+    output = get_agent_content(result)
     
     # JSON 추출
-    json_match = re.search(r'```json\s*(.*?)\s*```', output, re.DOTALL)
-    if json_match:
-        json_str = json_match.group(1)
-    else:
-        json_str = re.search(r'{.*}', output, re.DOTALL).group(0)
+    json_str = extract_json_str(output) or output
     
-    data = json.loads(json_str)
+    data = loads_json(json_str)
     
     logger.info(f"식단 추천 완료 - 식사 유형: {data['meal_type']}, 칼로리: {data['total_calories']}")
     
-    # 식품 항목 변환
-    food_items = []
-    for item_data in data["food_items"]:
-        food_items.append(FoodItem(
-            name=item_data["name"],
-            calories=item_data["calories"],
-            protein=item_data["protein"],
-            carbs=item_data["carbs"],
-            fat=item_data["fat"],
-            amount=item_data["amount"]
-        ))
-    
-    # 대체 식품 변환
-    alternatives = []
-    if "alternatives" in data and data["alternatives"]:
-        for alt_data in data["alternatives"]:
-            alternatives.append(FoodItem(
-                name=alt_data["name"],
-                calories=alt_data["calories"],
-                protein=alt_data["protein"],
-                carbs=alt_data["carbs"],
-                fat=alt_data["fat"],
-                amount=alt_data["amount"]
-            ))
+    # 식품 항목 변환 (목록 전체를 한 번에 검증)
+    food_items = _FOOD_ITEMS_ADAPTER.validate_python(data["food_items"])
     
     # 추천 결과 생성
     recommendation = MealRecommendation(
-        recommendation_id=str(uuid4()),
+        recommendation_id=new_id(),
         timestamp=datetime.now(),
         meal_type=data["meal_type"],
         food_items=food_items,
         total_calories=data["total_calories"],
-        nutrition_breakdown=data["nutrition_breakdown"],
-        reasoning=data["reasoning"],
-        alternatives=alternatives
+        nutrients=data.get("nutrients") or {},
+        description=data.get("description", "")
     )
     
     # 음성 스크립트 생성
@@ -262,7 +244,7 @@ async def provide_recommendations(state: UserState) -> MealRecommendation:
     )
     state.notifications.append(notification)
     
-    return END(recommendation)
+    return recommendation
 
 async def process_food_image(state: UserState, image_data: Dict[str, Any]) -> DietEntry:
     logger.info("음식 이미지 처리 시작")
@@ -295,38 +277,22 @@ async def process_food_image(state: UserState, image_data: Dict[str, Any]) -> Di
     # 에이전트 실행 및 결과 파싱
     result = await agent.ainvoke({"input": prompt})
     
-    # AIMessage 객체에서 content 추출
-    if hasattr(result, 'content'):
-        output = result.content
-    else:
-        output = str(result)
+    # 에이전트 응답에서 텍스트 추출 ({"content": ...} 딕셔너리 또는 AIMessage)
+    output = get_agent_content(result)
     
     # JSON 문자열 추출 및 파싱
-    import json
-    import re
-    
-    json_match = re.search(r'```json\s*(.*?)\s*```', output, re.DOTALL)
-    if json_match:
-        json_str = json_match.group(1)
-    else:
-        json_str = re.search(r'{.*}', output, re.DOTALL).group(0)
+    json_str = extract_json_str(output) or output
     
-    data = json.loads(json_str)
+    data = loads_json(json_str)
     
     logger.info(f"음식 이미지 처리 완료 - 식사 유형: {data['meal_type']}, 칼로리: {data['total_calories']}")
     
-    # 식품 항목 변환
-    food_items = []
-    for item_data in data["food_items"]:
-        food_items.append(FoodItem(
-            name=item_data["name"],
-            calories=item_data["calories"],
-            amount=item_data["amount"]
-        ))
+    # 식품 항목 변환 (목록 전체를 한 번에 검증)
+    food_items = _FOOD_ITEMS_ADAPTER.validate_python(data["food_items"])
     
     # 식단 기록 생성
     diet_entry = DietEntry(
-        entry_id=str(uuid4()),
+        entry_id=new_id(),
         timestamp=datetime.now(),
         meal_type=data["meal_type"],
         food_items=food_items,
@@ -1,21 +1,156 @@
-from typing import Dict, Any, List, Union, Optional
-from uuid import uuid4
-from datetime import datetime, timedelta
+from typing import Dict, Any, Callable, List, Optional
+import asyncio
+import copy
 import logging
 import json
-import re
-import urllib.parse
+from urllib.parse import quote_plus
 
-from langgraph.graph import END
+from pydantic import TypeAdapter, ValidationError
 
-from app.models.notification import UserState, AndroidNotification
-from app.models.exercise_data import ExerciseRecommendation
-from app.agents.agent_config import get_gemini_agent, RealGeminiAgent
+from app.models.exercise_data import ExercisePlan, ExerciseRecommendation
+from app.agents.agent_config import get_gemini_agent
+from app.agents.llm_cache import TTLCache, cached_invoke
+from app.config.settings import get_settings
 from app.db.health_dao import HealthDAO
+from app.utils.age import calculate_age_from_birth_date
+from app.utils.llm_json import canonical_json, extract_json_str, loads_json
 
 # 로거 설정
 logger = logging.getLogger(__name__)
 
+# 건강 DAO 인스턴스
+health_dao = HealthDAO()
+
+settings = get_settings()
+
+# 운동 추천에 사용하는 사용자 DB 조회 결과 캐시 (키: "<조회 종류>:<사용자 ID>")
+_USER_DATA_CACHE_TTL = 60
+_USER_DATA_KINDS = ("health_profile", "diet_history", "exercise_history")
+_user_data_cache = TTLCache(maxsize=1024)
+
+# LLM 응답의 운동 계획 목록 검증기
+_EXERCISE_PLANS_ADAPTER = TypeAdapter(List[ExercisePlan])
+
+# 운동별 YouTube 검색 링크 접두사
+_YOUTUBE_SEARCH_URL = "https://www.youtube.com/results?search_query="
+
+# 운동 프롬프트에 넣는 최근 식사 기록 수 (조회 결과는 최신순)
+_PROMPT_DIET_HISTORY_LIMIT = 14
+
+# 운동 추천 응답 캐시 유지 시간(초) - 같은 사용자 정보와 이력으로 다시 요청하면 LLM 호출을 생략
+_EXERCISE_RESPONSE_TTL = 24 * 3600
+
+# 운동 계획 추천 프롬프트의 고정 앞부분 (역할, 응답 형식, 고려사항)
+# 모든 요청에서 같은 문자열로 시작하므로 모델 측 프롬프트 접두사 캐시를 재사용할 수 있습니다
+_EXERCISE_PLAN_PREFIX = """
+        당신은 세계적인 운동 전문가로서 개인의 상황과 환경에 맞는 최적화된 운동 계획을 제공합니다. 아래 사용자 정보를 기반으로 맞춤형 운동 계획을 제안해주세요.
+        
+        다음 형식에 맞게 정확히 JSON 문자열만 응답해주세요. 설명이나 다른 텍스트는 포함하지 마세요:
+        
+        {"fitness_level": "초보자/중급자/고급자 중 하나", "recommended_frequency": "주 3회, 매일 등 권장 빈도", "exercise_plans": [{"name": "운동명 (예: 조깅, 스쿼트 등)", "description": "해당 장소와 장비를 고려한 세부 운동 방법", "duration": "권장 시간 (예: 30분)", "benefits": "효과"}], "special_instructions": ["주의사항1", "주의사항2"], "recommendation_summary": "전체적인 운동 계획 요약"}
+        
+        exercise_plans에는 3-5개 정도의 운동을 넣어주세요.
+        
+        특별한 고려사항:
+        1. 사용자가 제공한 운동 장소(집, 헬스장, 야외 등)에 적합한 운동만 추천하세요.
+        2. 사용 가능한 장비가 제한적이라면 그에 맞는 운동을 제안하세요.
+        3. 사용자의 운동 경험 수준에 맞는 난이도로 운동을 구성하세요.
+        4. 건강 상태나 제약사항을 고려하여 안전한 운동을 권장하세요.
+        5. 선호하는 운동 유형과 강도를 반영한 계획을 제시하세요.
+        6. 총 모든 운동을 완료하는데 걸리는 시간이 1시간 이하로 구성하세요.
+        7. 최근 조언한 운동 계획을 참고하여 운동 계획을 구성하세요. 가급적 가장 최근에 추천한 운동은 추천하지 마세요.
+        """
+
+# 운동 계획 프롬프트의 사용자별 부분 (str.format 템플릿, _EXERCISE_PLAN_PREFIX 뒤에 붙입니다)
+_EXERCISE_PLAN_PROMPT = """
+        ### 사용자 기본 정보:
+        - 나이: {age}
+        - 성별: {gender}
+        - 키: {height}
+        - 체중: {weight}
+        - 건강 상태: {conditions_str}
+        
+        ### 최근 3개월 건강 지표 추이 (지표별 시작값, 최신값, 측정 횟수):
+        {health_metrics_history}
+        
+        ### 최근 1달간 식단 정보 (최신순):
+        {diet_history}
+        
+        ### 최근 운동 추천 기록:
+        {exercise_history}
+        
+        ### 운동 환경 및 선호도:
+        - 운동 장소: {exercise_location}
+        - 선호하는 운동 유형: {preferred_exercise_type}
+        - 사용 가능한 장비: {equipment_str}
+        - 세션당 가능한 운동 시간: {time_per_session}분
+        - 운동 경험 수준: {experience_level}
+        - 선호하는 운동 강도: {intensity_preference}
+        - 운동 제약사항/주의사항: {constraints_str}
+        
+        ### 운동 목적:
+        {exercise_goal}
+        """
+
+# LLM 응답을 사용할 수 없을 때의 기본 운동 계획 데이터
+# (운동 계획에 youtube_link를 추가하므로 사용할 때는 copy.deepcopy로 복사합니다)
+_FALLBACK_EXERCISE_DATA: Dict[str, Any] = {
+    "fitness_level": "초보자",
+    "recommended_frequency": "주 3회",
+    "exercise_plans": [
+        {
+            "name": "걷기",
+            "description": "평지에서 빠른 걸음으로 걷기",
+            "duration": "30분",
+            "benefits": "심폐 건강 향상, 체중 관리"
+        }
+    ],
+    "special_instructions": ["무리하지 말고 천천히 시작하세요."],
+    "recommendation_summary": "가벼운 걷기로 시작하여 점차 운동 강도를 높이는 것을 추천합니다."
+}
+
+def _summarize_metrics_history(history: Dict[str, List[Dict[str, Any]]]) -> Dict[str, Dict[str, Any]]:
+    """건강 지표 시계열을 지표별 시작값, 최신값, 측정 횟수로 요약합니다. (측정값이 없는 지표는 제외)"""
+    return {
+        metric: {"start": points[0]["value"], "latest": points[-1]["value"], "count": len(points)}
+        for metric, points in history.items()
+        if points
+    }
+
+def _summarize_diet_history(rows: List[Dict[str, Any]]) -> str:
+    """식단 기록을 '- 날짜 식사: 음식(칼로리), ...' 형식의 줄로 요약합니다. (최대 _PROMPT_DIET_HISTORY_LIMIT개)"""
+    lines = []
+    for row in rows[:_PROMPT_DIET_HISTORY_LIMIT]:
+        foods = ", ".join(
+            f"{item.get('name', '')}({item['calories']}kcal)" if item.get('calories') is not None else f"{item.get('name', '')}"
+            for item in row.get("food_items") or []
+        )
+        lines.append(f"- {row.get('meal_date', '')} {row.get('meal_type', '')}: {foods}")
+    return "\n".join(lines)
+
+async def _fetch_user_data(kind: str, fetch: Callable[..., Any], user_id: str, **kwargs) -> Any:
+    """DAO 조회를 스레드에서 실행하고, 같은 사용자의 최근 조회 결과가 있으면 재사용합니다."""
+    key = f"{kind}:{user_id}"
+    cached = _user_data_cache.get(key)
+    if cached is not None:
+        logger.debug("[EXERCISE_NODE] 사용자 데이터 캐시 적중: %s", key)
+        return cached
+
+    value = await asyncio.to_thread(fetch, user_id, **kwargs)
+    if value is not None:
+        _user_data_cache.set(key, value, _USER_DATA_CACHE_TTL)
+    return value
+
+def invalidate_user_data_cache(user_id: str) -> None:
+    """
+    사용자의 건강 지표, 식단, 운동 추천이 변경되었을 때 캐시된 조회 결과를 제거합니다.
+    
+    Args:
+        user_id: 사용자 ID
+    """
+    for kind in _USER_DATA_KINDS:
+        _user_data_cache.delete(f"{kind}:{user_id}")
+
 async def recommend_exercise_plan(state: Dict[str, Any]) -> Dict[str, Any]:
     """
     사용자의 목적에 맞는 운동 계획 추천
@@ -36,54 +171,52 @@ async def recommend_exercise_plan(state: Dict[str, Any]) -> Dict[str, Any]:
             exercise_goal = state["query_text"]
             logger.info(f"[EXERCISE_NODE] 운동 목적 쿼리: '{exercise_goal}'")
         
-        # 사용자 정보 조회
-        health_dao = HealthDAO()
+        # DAO를 통해 건강 프로필(사용자 기본 정보 포함), 최근 1달간의 식단, 최근 운동 추천을 동시에 조회
+        logger.info(f"[EXERCISE_NODE] 사용자 건강 프로필/식단/운동 추천 데이터 조회 시작 - 사용자 ID: {user_id}")
+        user_health_profile, recent_diet_history, recent_exercise_recommendations = await asyncio.gather(
+            _fetch_user_data("health_profile", health_dao.get_complete_health_profile, user_id),
+            _fetch_user_data("diet_history", health_dao.get_recent_diet_advice_history, user_id, months=1),
+            _fetch_user_data("exercise_history", health_dao.get_user_exercise_recommendations, user_id, limit=1),
+            return_exceptions=True,
+        )
         
-        # DAO를 통해 사용자 완전한 건강 프로필 조회 (사용자 기본 정보 포함)
-        logger.info(f"[EXERCISE_NODE] 사용자 건강 프로필 조회 시작 - 사용자 ID: {user_id}")
-        user_health_profile = health_dao.get_complete_health_profile(user_id)
+        # 조회에 실패한 데이터는 없는 것으로 처리하고 나머지로 추천을 계속합니다
+        if isinstance(user_health_profile, Exception):
+            logger.error(f"[EXERCISE_NODE] 건강 프로필 조회 오류: {str(user_health_profile)}")
+            user_health_profile = None
+        if isinstance(recent_diet_history, Exception):
+            logger.error(f"[EXERCISE_NODE] 최근 식단 데이터 조회 오류: {str(recent_diet_history)}")
+            recent_diet_history = []
+        if isinstance(recent_exercise_recommendations, Exception):
+            logger.error(f"[EXERCISE_NODE] 최근 운동 추천 데이터 조회 오류: {str(recent_exercise_recommendations)}")
+            recent_exercise_recommendations = []
         
-        # 최근 1달간의 식단 데이터 조회
-        logger.info(f"[EXERCISE_NODE] 사용자 최근 식단 데이터 조회 시작 - 사용자 ID: {user_id}")
-        recent_diet_history = health_dao.get_recent_diet_advice_history(user_id, months=1)
-        diet_history_data = []
+        # 최근 1달간의 식단 데이터 정리
+        diet_history_str = "없음"
         
         if recent_diet_history:
             logger.info(f"[EXERCISE_NODE] 최근 식단 데이터 {len(recent_diet_history)}개 조회 성공")
-            # 필요한 필드만 추출하여 정리
-            for diet_entry in recent_diet_history:
-                diet_data = {
-                    "meal_date": diet_entry.get("meal_date", "").strftime("%Y-%m-%d") if hasattr(diet_entry.get("meal_date", ""), "strftime") else diet_entry.get("meal_date", ""),
-                    "meal_type": diet_entry.get("meal_type", ""),
-                    "food_items": diet_entry.get("food_items", []),
-                    "created_at": diet_entry.get("created_at", "").strftime("%Y-%m-%d %H:%M:%S") if hasattr(diet_entry.get("created_at", ""), "strftime") else diet_entry.get("created_at", "")
-                }
-                diet_history_data.append(diet_data)
+            # 날짜, 식사, 음식(칼로리)만 남긴 줄 단위 요약
+            diet_history_str = _summarize_diet_history(recent_diet_history)
         else:
             logger.info(f"[EXERCISE_NODE] 최근 식단 데이터 없음")
         
-        # 최근 운동 추천 데이터 조회
-        logger.info(f"[EXERCISE_NODE] 사용자 최근 운동 추천 데이터 조회 시작 - 사용자 ID: {user_id}")
-        recent_exercise_recommendations = health_dao.get_user_exercise_recommendations(user_id, limit=1)
+        # 최근 운동 추천 데이터 정리
         exercise_history_data = []
         
         if recent_exercise_recommendations:
             logger.info(f"[EXERCISE_NODE] 최근 운동 추천 데이터 {len(recent_exercise_recommendations)}개 조회 성공")
-            # 필요한 필드만 추출하여 정리
-            for recommendation in recent_exercise_recommendations:
-                lst_exercise_plans = []
-                for plan in recommendation.exercise_plans:
-                    exercise_name = plan.get("name", "")
-                    lst_exercise_plans.append(exercise_name)
-                exercise_data = {
-                    "exercise_plans": lst_exercise_plans
-                }
-                exercise_history_data.append(exercise_data)
+            # 필요한 필드(운동명)만 추출하여 정리
+            exercise_history_data = [
+                {"exercise_plans": [plan.name for plan in recommendation.exercise_plans if plan.name]}
+                for recommendation in recent_exercise_recommendations
+            ]
         else:
             logger.info(f"[EXERCISE_NODE] 최근 운동 추천 데이터 없음")
         
         # 사용자 정보 병합
         user_profile = state.get("user_profile", {}) if isinstance(state, dict) else {}
+        health_metrics_history = {}
         
         # 건강 프로필 데이터 통합
         if user_health_profile:
@@ -105,16 +238,15 @@ async def recommend_exercise_plan(state: Dict[str, Any]) -> Dict[str, Any]:
                     user_profile['weight'] = weight
                     logger.info(f"[EXERCISE_NODE] 체중 정보 추가: {weight}kg")
                 
-                # 기타 건강 정보 추가
-                user_profile['health_metrics'] = health_metrics
+                # 기타 건강 정보 추가 (캐시된 조회 결과가 바뀌지 않도록 복사본 저장)
+                user_profile['health_metrics'] = copy.deepcopy(health_metrics)
             
             # 건강 지표 시계열 데이터 추출
-            health_metrics_history = {}
             if 'health_metrics_history' in user_health_profile:
                 health_metrics_history = user_health_profile['health_metrics_history']
                 logger.info(f"[EXERCISE_NODE] 건강 지표 시계열 데이터 추출: {', '.join(health_metrics_history.keys())}")
-                # 시계열 데이터를 사용자 프로필에 추가
-                user_profile['health_metrics_history'] = health_metrics_history
+                # 시계열 데이터를 사용자 프로필에 추가 (캐시된 조회 결과가 바뀌지 않도록 복사본 저장)
+                user_profile['health_metrics_history'] = copy.deepcopy(health_metrics_history)
             
             # 기본 정보 통합 (성별)
             if 'gender' in user_health_profile and user_health_profile['gender']:
@@ -123,9 +255,7 @@ async def recommend_exercise_plan(state: Dict[str, Any]) -> Dict[str, Any]:
             
             # 나이 계산 (생년월일이 있는 경우)
             if 'birth_date' in user_health_profile and user_health_profile['birth_date']:
-                birth_date = user_health_profile['birth_date']
-                today = datetime.now().date()
-                age = today.year - birth_date.year - ((today.month, today.day) < (birth_date.month, birth_date.day))
+                age = calculate_age_from_birth_date(user_health_profile['birth_date'])
                 user_profile['age'] = age
                 logger.info(f"[EXERCISE_NODE] 나이 정보 추가: {age}세")
         
@@ -159,141 +289,85 @@ async def recommend_exercise_plan(state: Dict[str, Any]) -> Dict[str, Any]:
         health_conditions = user_profile.get("medical_conditions", [])
         conditions_str = "없음" if not health_conditions else ", ".join(health_conditions)
         
-        # Gemini 에이전트 초기화
-        agent = get_gemini_agent(temperature=0.7)
-        
-        logger.info(f"[EXERCISE_NODE] 운동 전문가 AI 호출 준비")
-        
-        # 장비 정보 문자열
-        equipment_str = "없음" if not available_equipment else ", ".join(available_equipment)
-        
-        # 제약사항 문자열
-        constraints_str = "없음" if not exercise_constraints else ", ".join(exercise_constraints)
-        
-        # 프롬프트 구성
-        prompt = f"""
-        당신은 세계적인 운동 전문가로서 개인의 상황과 환경에 맞는 최적화된 운동 계획을 제공합니다. 다음 사용자에게 상세한 정보를 기반으로 맞춤형 운동 계획을 제안해주세요:
-        
-        ### 사용자 기본 정보:
-        - 나이: {age}
-        - 성별: {gender}
-        - 키: {height}
-        - 체중: {weight}
-        - 건강 상태: {conditions_str}
-        
-        ### 건강 지표 시계열 데이터:
-        {json.dumps(health_metrics_history, ensure_ascii=False, indent=2)}
-        
-        ### 최근 1달간 식단 정보:
-        {json.dumps(diet_history_data, ensure_ascii=False, indent=2)}
-        
-        ### 최근 운동 추천 기록:
-        {json.dumps(exercise_history_data, ensure_ascii=False, indent=2)}
-        
-        ### 운동 환경 및 선호도:
-        - 운동 장소: {exercise_location}
-        - 선호하는 운동 유형: {preferred_exercise_type}
-        - 사용 가능한 장비: {equipment_str}
-        - 세션당 가능한 운동 시간: {time_per_session}분
-        - 운동 경험 수준: {experience_level}
-        - 선호하는 운동 강도: {intensity_preference}
-        - 운동 제약사항/주의사항: {constraints_str}
-        
-        ### 운동 목적:
-        {exercise_goal}
-        
-        다음 형식에 맞게 정확히 JSON 문자열만 응답해주세요. 설명이나 다른 텍스트는 포함하지 마세요:
-        
-        {{
-            "fitness_level": "초보자/중급자/고급자 중 하나",
-            "recommended_frequency": "주 3회, 매일 등 권장 빈도",
-            "exercise_plans": [
-                {{
-                    "name": "운동명 (예: 조깅, 스쿼트 등)",
-                    "description": "해당 장소와 장비를 고려한 세부 운동 방법",
-                    "duration": "권장 시간 (예: 30분)",
-                    "benefits": "효과"
-                }},
-                // 3-5개 정도의 추천 운동
-            ],
-            "special_instructions": ["주의사항1", "주의사항2"],
-            "recommendation_summary": "전체적인 운동 계획 요약"
-        }}
-        
-        특별한 고려사항:
-        1. 사용자가 제공한 운동 장소(집, 헬스장, 야외 등)에 적합한 운동만 추천하세요.
-        2. 사용 가능한 장비가 제한적이라면 그에 맞는 운동을 제안하세요.
-        3. 사용자의 운동 경험 수준에 맞는 난이도로 운동을 구성하세요.
-        4. 건강 상태나 제약사항을 고려하여 안전한 운동을 권장하세요.
-        5. 선호하는 운동 유형과 강도를 반영한 계획을 제시하세요.
-        6. 총 모든 운동을 완료하는데 걸리는 시간이 1시간 이하로 구성하세요.
-        7. 최근 조언한 운동 계획을 참고하여 운동 계획을 구성하세요. 가급적 가장 최근에 추천한 운동은 추천하지 마세요.
-        """
-        
-        logger.info(f"[EXERCISE_NODE] Gemini API 호출 시작")
-        
-        # AI 호출
-        response = await agent.ainvoke(prompt)
-        
-        logger.info(f"[EXERCISE_NODE] Gemini API 응답 수신")
-        
-        # 결과 파싱
-        try:
-            # 응답 JSON 추출
-            if isinstance(response, dict) and 'content' in response:
-                content = response['content']
-                exercise_data = extract_json(content)
-            else:
-                exercise_data = extract_json(str(response))
+        # 건강 지표와 운동 추천 이력이 모두 없는 사용자는 설정에 따라 LLM 호출 없이 기본 계획 사용
+        if not settings.LLM_COLD_START and not user_profile.get('health_metrics') and not exercise_history_data:
+            logger.info("[EXERCISE_NODE] 건강 지표/운동 이력 없음 - 기본 운동 계획 사용")
+            exercise_data = copy.deepcopy(_FALLBACK_EXERCISE_DATA)
+        else:
+            # Gemini 에이전트 초기화 (JSON 본문만 응답하도록 요청)
+            agent = get_gemini_agent(temperature=0.7, response_mime_type="application/json")
+            
+            logger.info(f"[EXERCISE_NODE] 운동 전문가 AI 호출 준비")
+            
+            # 장비 정보 문자열
+            equipment_str = "없음" if not available_equipment else ", ".join(available_equipment)
+            
+            # 제약사항 문자열
+            constraints_str = "없음" if not exercise_constraints else ", ".join(exercise_constraints)
+            
+            # 프롬프트 구성
+            prompt = _EXERCISE_PLAN_PREFIX + _EXERCISE_PLAN_PROMPT.format(
+                age=age,
+                gender=gender,
+                height=height,
+                weight=weight,
+                conditions_str=conditions_str,
+                health_metrics_history=canonical_json(_summarize_metrics_history(health_metrics_history)),
+                diet_history=diet_history_str,
+                exercise_history=" / ".join(
+                    ", ".join(entry["exercise_plans"]) for entry in exercise_history_data
+                ) or "없음",
+                exercise_location=exercise_location,
+                preferred_exercise_type=preferred_exercise_type,
+                equipment_str=equipment_str,
+                time_per_session=time_per_session,
+                experience_level=experience_level,
+                intensity_preference=intensity_preference,
+                constraints_str=constraints_str,
+                exercise_goal=exercise_goal,
+            )
             
-            if not exercise_data:
-                logger.warning("[EXERCISE_NODE] 응답에서 JSON 추출 실패")
-                exercise_data = {
-                    "fitness_level": "초보자",
-                    "recommended_frequency": "주 3회",
-                    "exercise_plans": [
-                        {
-                            "name": "걷기",
-                            "description": "평지에서 빠른 걸음으로 걷기",
-                            "duration": "30분",
-                            "benefits": "심폐 건강 향상, 체중 관리"
-                        }
-                    ],
-                    "special_instructions": ["무리하지 말고 천천히 시작하세요."],
-                    "recommendation_summary": "가벼운 걷기로 시작하여 점차 운동 강도를 높이는 것을 추천합니다."
-                }
-        except Exception as e:
-            logger.error(f"[EXERCISE_NODE] JSON 파싱 오류: {str(e)}")
-            exercise_data = {
-                "fitness_level": "초보자",
-                "recommended_frequency": "주 3회",
-                "exercise_plans": [
-                    {
-                        "name": "걷기",
-                        "description": "평지에서 빠른 걸음으로 걷기",
-                        "duration": "30분",
-                        "benefits": "심폐 건강 향상, 체중 관리"
-                    }
-                ],
-                "special_instructions": ["무리하지 말고 천천히 시작하세요."],
-                "recommendation_summary": "가벼운 걷기로 시작하여 점차 운동 강도를 높이는 것을 추천합니다."
-            }
+            logger.info(f"[EXERCISE_NODE] Gemini API 호출 시작")
+            
+            # AI 호출 (같은 프롬프트의 최근 응답이 있으면 재사용)
+            response = await cached_invoke(agent, prompt, ttl=_EXERCISE_RESPONSE_TTL)
+            
+            logger.info(f"[EXERCISE_NODE] Gemini API 응답 수신")
+            
+            # 결과 파싱
+            try:
+                # 응답 JSON 추출
+                if isinstance(response, dict) and 'content' in response:
+                    content = response['content']
+                    exercise_data = extract_json(content)
+                else:
+                    exercise_data = extract_json(str(response))
+            
+                if not exercise_data:
+                    logger.warning("[EXERCISE_NODE] 응답에서 JSON 추출 실패")
+                    exercise_data = copy.deepcopy(_FALLBACK_EXERCISE_DATA)
+                else:
+                    # 운동 계획 형식 검증 (이름이 없는 운동은 제외)
+                    plans = _EXERCISE_PLANS_ADAPTER.validate_python(exercise_data.get("exercise_plans") or [])
+                    plans = [plan for plan in plans if plan.name]
+                    if plans:
+                        exercise_data["exercise_plans"] = [plan.model_dump() for plan in plans]
+                    else:
+                        logger.warning("[EXERCISE_NODE] 응답에 유효한 운동 계획 없음 - 기본 계획 사용")
+                        exercise_data = copy.deepcopy(_FALLBACK_EXERCISE_DATA)
+            except ValidationError as e:
+                logger.warning(f"[EXERCISE_NODE] 운동 계획 형식 오류 - 기본 계획 사용: {str(e)}")
+                exercise_data = copy.deepcopy(_FALLBACK_EXERCISE_DATA)
+            except Exception as e:
+                logger.error(f"[EXERCISE_NODE] JSON 파싱 오류: {str(e)}")
+                exercise_data = copy.deepcopy(_FALLBACK_EXERCISE_DATA)
         
         logger.info(f"[EXERCISE_NODE] 운동 계획 구성 시작")
         
-        # YouTube 링크 생성
-        updated_exercise_plans = []
+        # YouTube 검색 링크 생성 (운동 계획 딕셔너리에 직접 추가)
         for plan in exercise_data.get("exercise_plans", []):
-            exercise_name = plan.get("name", "")
-            if exercise_name:
-                # YouTube 검색 링크 생성
-                search_query = f"{exercise_name} 운동 방법"
-                youtube_link = f"https://www.youtube.com/results?search_query={urllib.parse.quote(search_query)}"
-                plan["youtube_link"] = youtube_link
-            updated_exercise_plans.append(plan)
-        
-        # 추천 데이터 업데이트
-        exercise_data["exercise_plans"] = updated_exercise_plans
+            if exercise_name := plan.get("name"):
+                plan["youtube_link"] = f"{_YOUTUBE_SEARCH_URL}{quote_plus(exercise_name + ' 운동 방법')}"
         
         # ExerciseRecommendation 객체 생성
         recommendation = ExerciseRecommendation(
@@ -334,28 +408,15 @@ async def recommend_exercise_plan(state: Dict[str, Any]) -> Dict[str, Any]:
 
 def extract_json(text: str) -> Optional[Dict[str, Any]]:
     """텍스트에서 JSON 데이터를 추출하는 함수"""
-    try:
-        # JSON 코드 블록 찾기 (```json ... ``` 형식)
-        json_block_pattern = r"```(?:json)?\s*([\s\S]*?)```"
-        json_blocks = re.findall(json_block_pattern, text)
-        
-        if json_blocks:
-            logger.info("[EXERCISE_NODE] JSON 코드 블록 찾음")
-            json_str = json_blocks[0].strip()
-            return json.loads(json_str)
-        
-        # 중괄호 기반 JSON 찾기
-        json_pattern = r"(\{[\s\S]*\})"
-        json_matches = re.findall(json_pattern, text)
-        
-        if json_matches:
-            # 가장 긴 JSON 문자열을 선택 (완전한 JSON 객체일 가능성이 높음)
-            logger.info("[EXERCISE_NODE] 중괄호 기반 JSON 찾음")
-            json_str = max(json_matches, key=len).strip()
-            return json.loads(json_str)
-        
+    json_str = extract_json_str(text)
+    if json_str is None:
         logger.warning("[EXERCISE_NODE] 텍스트에서 JSON을 찾을 수 없습니다.")
         return None
-    except Exception as e:
+    
+    try:
+        data = loads_json(json_str)
+    except json.JSONDecodeError as e:
         logger.error(f"[EXERCISE_NODE] JSON 추출 중 오류: {str(e)}")
-        return None 
\ No newline at end of file
+        return None
+    
+    return data if isinstance(data, dict) else None
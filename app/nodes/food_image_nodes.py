@@ -1,9 +1,7 @@
 import logging
 from typing import Dict, Any, List, Union
-from uuid import uuid4
 from datetime import datetime
 import json
-import re
 
 from langgraph.graph import END
 
@@ -15,7 +13,10 @@ from app.models.diet_plan import (
     FoodNutritionAnalysis,
     DietEntry
 )
+from app.models._ids import new_id
 from app.agents.agent_config import get_diet_agent
+from app.utils.age import calculate_age_from_birth_date
+from app.utils.llm_json import extract_json_str, get_agent_content, loads_json
 
 # 로거 설정
 logger = logging.getLogger(__name__)
@@ -61,7 +62,7 @@ async def analyze_food_image(state: UserState, config: Dict[str, Any] = None) ->
         return {"error": "이미지 데이터가 없습니다"}
     
     # 이미지 ID 생성 (실제로는 이미지 저장 시 생성된 ID를 사용)
-    image_id = str(uuid4())
+    image_id = new_id()
     user_id = state.user_profile.get("user_id", "unknown_user")
     
     # 실제 구현에서는 여기서 이미지 인식 API나 모델을 호출
@@ -144,18 +145,20 @@ async def calculate_nutrition(state: UserState, config: Dict[str, Any] = None) -
     # 영양소 비율 계산 (%)
     nutrition_percentage = {}
     if total_nutrition_weight > 0:
-        for nutrient, value in estimated_nutrition.items():
-            nutrition_percentage[nutrient] = round((value / total_nutrition_weight) * 100, 1)
+        nutrition_percentage = {
+            nutrient: round((value / total_nutrition_weight) * 100, 1)
+            for nutrient, value in estimated_nutrition.items()
+        }
     
     # 식사 품질 점수 계산 (간단한 알고리즘)
     # 이상적인 영양소 비율: 단백질 20%, 탄수화물 50%, 지방 30%
     ideal_ratio = {"protein": 20, "carbs": 50, "fat": 30}
     
     # 차이 계산
-    ratio_diff = 0
-    for nutrient, ideal in ideal_ratio.items():
-        actual = nutrition_percentage.get(nutrient, 0)
-        ratio_diff += abs(ideal - actual)
+    ratio_diff = sum(
+        abs(ideal - nutrition_percentage.get(nutrient, 0))
+        for nutrient, ideal in ideal_ratio.items()
+    )
     
     # 점수 계산 (100점 만점, 차이가 클수록 점수 낮음)
     meal_quality_score = max(0, 10 - (ratio_diff / 10))
@@ -214,7 +217,7 @@ async def generate_diet_feedback(state: UserState, config: Dict[str, Any] = None
     사용자 정보:
     - 이름: {user_profile.get('name', '사용자')}
     - 성별: {user_profile.get('gender', '정보 없음')}
-    - 나이: {datetime.now().year - user_profile.get('birth_date', datetime.now()).year if 'birth_date' in user_profile else '정보 없음'}
+    - 나이: {calculate_age_from_birth_date(user_profile.get('birth_date'))}
     - 현재 체중: {health_metrics.get('weight', '정보 없음')} kg
     - 현재 BMI: {health_metrics.get('bmi', '정보 없음')}
     - 식이 제한사항: {', '.join(dietary_restrictions) if dietary_restrictions else '없음'}
@@ -245,21 +248,14 @@ async def generate_diet_feedback(state: UserState, config: Dict[str, Any] = None
     # 에이전트 실행
     result = await agent.ainvoke({"input": prompt})
     
-    # AIMessage 객체에서 content 추출
-    if hasattr(result, 'content'):
-        output = result.content
-    else:
-        output = str(result)
+    # 에이전트 응답에서 텍스트 추출 ({"content": ...} 딕셔너리 또는 AIMessage)
+    output = get_agent_content(result)
     
     # JSON 문자열 추출 및 파싱
-    json_match = re.search(r'```json\s*(.*?)\s*```', output, re.DOTALL)
-    if json_match:
-        json_str = json_match.group(1)
-    else:
-        json_str = re.search(r'{.*}', output, re.DOTALL).group(0)
+    json_str = extract_json_str(output) or output
     
     try:
-        data = json.loads(json_str)
+        data = loads_json(json_str)
     except json.JSONDecodeError:
         logger.error("JSON 파싱 오류")
         data = {
@@ -270,8 +266,8 @@ async def generate_diet_feedback(state: UserState, config: Dict[str, Any] = None
         }
     
     # DietEntry 생성
-    entry_id = str(uuid4())
-    meal_id = str(uuid4())
+    entry_id = new_id()
+    meal_id = new_id()
     diet_entry = DietEntry(
         entry_id=entry_id,
         meal_id=meal_id,
@@ -327,7 +323,7 @@ async def create_diet_image_summary(state: UserState, config: Dict[str, Any] = N
     
     # meal_id가 없으면 추가
     if not hasattr(diet_entry, 'meal_id') or diet_entry.meal_id is None:
-        diet_entry.meal_id = str(uuid4())
+        diet_entry.meal_id = new_id()
         logger.info(f"식단 항목에 meal_id 추가: {diet_entry.meal_id}")
     
     # END 노드를 위한 결과 생성
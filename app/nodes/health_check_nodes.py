@@ -1,20 +1,32 @@
 from typing import Dict, Any, List, Union, Optional
-from uuid import uuid4
 from datetime import datetime, timedelta
 import logging
 import json
-import re
 
 from langgraph.graph import END
 
 from app.models.health_data import HealthAssessment, HealthMetrics, Symptom
 from app.models.notification import UserState, AndroidNotification
+from app.models._ids import new_id
 from app.agents.agent_config import get_health_agent, RealGeminiAgent
 from app.db.health_dao import HealthDAO
+from app.utils.diet_history import normalize_diet_history
+from app.utils.llm_json import canonical_json, extract_json_str
 
 # 로거 설정
 logger = logging.getLogger(__name__)
 
+# 건강 DAO 인스턴스
+health_dao = HealthDAO()
+
+def _format_symptoms(symptoms: List[Dict[str, Any]]) -> str:
+    """증상 목록을 프롬프트/알림용 텍스트로 정리합니다."""
+    return "\n".join(
+        f"- {symptom.get('description')}: 심각도 {symptom.get('severity')}/10, "
+        f"시작 시간: {symptom.get('onset_time').strftime('%Y-%m-%d %H:%M')}"
+        for symptom in symptoms
+    )
+
 async def analyze_health_metrics(state: Dict[str, Any]) -> HealthAssessment:
     """
     사용자의 건강 지표 분석
@@ -36,9 +48,6 @@ async def analyze_health_metrics(state: Dict[str, Any]) -> HealthAssessment:
         health_metrics = {}
         health_metrics_history = {}
         
-        # 데이터 액세스 객체 초기화
-        health_dao = HealthDAO()
-        
         # 운동 이력 데이터 조회
         logger.info(f"[HEALTH_CHECK] 사용자 운동 이력 조회 시작 - 사용자 ID: {state.health_metrics['user_id']}")
         exercise_recommendations = health_dao.get_user_exercise_recommendations(state.health_metrics['user_id'], limit=30)
@@ -46,16 +55,12 @@ async def analyze_health_metrics(state: Dict[str, Any]) -> HealthAssessment:
         
         if exercise_recommendations:
             logger.info(f"[HEALTH_CHECK] 운동 이력 데이터 {len(exercise_recommendations)}개 조회 성공")
-            # 필요한 필드만 추출하여 정리
-            for recommendation in exercise_recommendations:
-                lst_exercise_plans = []
-                for plan in recommendation.exercise_plans:
-                    exercise_name = plan.get("name", "")
-                    lst_exercise_plans.append(exercise_name)
-                exercise_data = {
-                    "exercise_plans": lst_exercise_plans
-                }
-                exercise_history_data.append(exercise_data)
+            # 필요한 필드(운동명)만 추출하여 정리
+            # exercise_plans는 ExercisePlan 모델 목록이므로 속성으로 접근합니다
+            exercise_history_data = [
+                {"exercise_plans": [plan.name for plan in recommendation.exercise_plans]}
+                for recommendation in exercise_recommendations
+            ]
         else:
             logger.info(f"[HEALTH_CHECK] 운동 이력 데이터 없음")
             
@@ -66,23 +71,8 @@ async def analyze_health_metrics(state: Dict[str, Any]) -> HealthAssessment:
         
         if recent_diet_history:
             logger.info(f"[HEALTH_CHECK] 식단 이력 데이터 {len(recent_diet_history)}개 조회 성공")
-            # 필요한 필드만 추출하여 정리
-            for diet_entry in recent_diet_history:
-                # food_items에서 calories 제거
-                processed_food_items = []
-                if diet_entry.get("food_items"):
-                    for food_item in diet_entry.get("food_items", []):
-                        # calories 필드 제외하고 새 딕셔너리 생성
-                        clean_food_item = {k: v for k, v in food_item.items() if k != 'calories'}
-                        processed_food_items.append(clean_food_item)
-                
-                diet_data = {
-                    "meal_date": diet_entry.get("meal_date", "").strftime("%Y-%m-%d") if hasattr(diet_entry.get("meal_date", ""), "strftime") else diet_entry.get("meal_date", ""),
-                    "meal_type": diet_entry.get("meal_type", ""),
-                    "food_items": processed_food_items,
-                    "created_at": diet_entry.get("created_at", "").strftime("%Y-%m-%d %H:%M:%S") if hasattr(diet_entry.get("created_at", ""), "strftime") else diet_entry.get("created_at", "")
-                }
-                diet_history_data.append(diet_data)
+            # 필요한 필드만 추출하여 정리 (food_items에서 calories 제외)
+            diet_history_data = normalize_diet_history(recent_diet_history)
         else:
             logger.info(f"[HEALTH_CHECK] 식단 이력 데이터 없음")
         
@@ -123,7 +113,7 @@ async def analyze_health_metrics(state: Dict[str, Any]) -> HealthAssessment:
             logger.warning("분석할 건강 지표가 없습니다")
             # 건강 지표가 없을 경우 바로 정보 부족 상태 반환
             assessment = HealthAssessment(
-                assessment_id=str(uuid4()),
+                assessment_id=new_id(),
                 user_id=state.health_metrics['user_id'],
                 health_status="정보 부족",
                 concerns=["건강 지표 정보가 제공되지 않았습니다.", "현재 건강 상태를 평가할 수 있는 데이터가 없습니다."],
@@ -150,15 +140,15 @@ async def analyze_health_metrics(state: Dict[str, Any]) -> HealthAssessment:
         사용자 ID: {state.health_metrics['user_id']}
         질문: {state.query_text}
         
-        최신 건강 지표: {json.dumps(health_metrics, ensure_ascii=False, indent=2)}
+        최신 건강 지표: {canonical_json(health_metrics)}
         
-        건강 지표 시계열 데이터: {json.dumps(health_metrics_history, ensure_ascii=False, indent=2)}
+        건강 지표 시계열 데이터: {canonical_json(health_metrics_history)}
         
         최근 운동 이력:
-        {json.dumps(exercise_history_data, ensure_ascii=False, indent=2)}
+        {canonical_json(exercise_history_data)}
         
         최근 1달간 식단 이력:
-        {json.dumps(diet_history_data, ensure_ascii=False, indent=2)}
+        {canonical_json(diet_history_data)}
         
         매우 중요: 반드시 아래 JSON 형식으로만 응답해주세요. 다른 텍스트나 설명은 추가하지 마세요.
         
@@ -242,7 +232,7 @@ async def analyze_health_metrics(state: Dict[str, Any]) -> HealthAssessment:
         
         # HealthAssessment 객체 생성
         assessment = HealthAssessment(
-            assessment_id=str(uuid4()),
+            assessment_id=new_id(),
             user_id=state.health_metrics['user_id'],
             health_status=assessment_data.get('health_status', '정보 부족'),
             concerns=assessment_data.get('concerns', []),
@@ -265,29 +255,11 @@ async def analyze_health_metrics(state: Dict[str, Any]) -> HealthAssessment:
 
 def extract_json(text: str) -> Optional[str]:
     """텍스트에서 JSON 문자열을 추출하는 함수"""
-    try:
-        # JSON 코드 블록 찾기 (```json ... ``` 형식)
-        json_block_pattern = r"```(?:json)?\s*([\s\S]*?)```"
-        json_blocks = re.findall(json_block_pattern, text)
-        
-        if json_blocks:
-            logger.info("JSON 코드 블록 찾음")
-            return json_blocks[0].strip()
-        
-        # 중괄호 기반 JSON 찾기
-        json_pattern = r"(\{[\s\S]*\})"
-        json_matches = re.findall(json_pattern, text)
-        
-        if json_matches:
-            # 가장 긴 JSON 문자열을 선택 (완전한 JSON 객체일 가능성이 높음)
-            logger.info("중괄호 기반 JSON 찾음")
-            return max(json_matches, key=len).strip()
-        
+    json_str = extract_json_str(text)
+    if json_str is None:
         logger.warning("텍스트에서 JSON을 찾을 수 없습니다.")
         return None
-    except Exception as e:
-        logger.error(f"JSON 추출 중 오류: {str(e)}")
-        return None
+    return json_str.strip()
 
 async def alert_health_concern(state: UserState, assessment: HealthAssessment) -> AndroidNotification:
     logger.info(f"건강 우려 사항 알림 생성 - 상태: {assessment.health_status}")
@@ -326,7 +298,7 @@ async def analyze_symptoms(state: UserState) -> HealthAssessment:
     if not symptoms:
         logger.warning("분석할 증상이 없습니다")
         return HealthAssessment(
-            assessment_id=str(uuid4()),
+            assessment_id=new_id(),
             timestamp=datetime.now(),
             health_status="정보 없음",
             has_concerns=False,
@@ -339,11 +311,7 @@ async def analyze_symptoms(state: UserState) -> HealthAssessment:
     agent = get_health_agent()
     
     # 사용자 증상 데이터 준비
-    symptoms_data = "\n".join([
-        f"- {symptom.get('description')}: 심각도 {symptom.get('severity')}/10, " +
-        f"시작 시간: {symptom.get('onset_time').strftime('%Y-%m-%d %H:%M')}"
-        for symptom in symptoms
-    ])
+    symptoms_data = _format_symptoms(symptoms)
     
     user_profile = state.user_profile
     age = user_profile.get("age", "알 수 없음")
@@ -388,13 +356,7 @@ async def analyze_symptoms(state: UserState) -> HealthAssessment:
         output = str(result)
     
     # JSON 문자열 추출 및 파싱
-    import re
-    
-    json_match = re.search(r'```json\s*(.*?)\s*```', output, re.DOTALL)
-    if json_match:
-        json_str = json_match.group(1)
-    else:
-        json_str = re.search(r'{.*}', output, re.DOTALL).group(0)
+    json_str = extract_json_str(output) or output
     
     data = json.loads(json_str)
     
@@ -402,7 +364,7 @@ async def analyze_symptoms(state: UserState) -> HealthAssessment:
     
     # 분석 결과 생성
     assessment = HealthAssessment(
-        assessment_id=str(uuid4()),
+        assessment_id=new_id(),
         timestamp=datetime.now(),
         health_status=data["health_status"],
         has_concerns=data["has_concerns"],
@@ -432,11 +394,7 @@ async def notify_doctor(state: UserState, assessment: HealthAssessment) -> Dict[
     user_name = f"{user_profile.get('first_name', '')} {user_profile.get('last_name', '')}"
     
     # 증상 정보 수집
-    symptoms_data = "\n".join([
-        f"- {symptom.get('description')}: 심각도 {symptom.get('severity')}/10, " +
-        f"시작 시간: {symptom.get('onset_time').strftime('%Y-%m-%d %H:%M')}"
-        for symptom in state.symptoms
-    ])
+    symptoms_data = _format_symptoms(state.symptoms)
     
     # 의사 알림 메시지 생성
     doctor_message = f"""
@@ -1,13 +1,15 @@
 from typing import Dict, Any, List, Union
-from uuid import uuid4
 from datetime import datetime, timedelta
+import json
 import logging
 
 from langgraph.graph import END
 
 from app.models.voice_data import VoiceQuery, VoiceResponse, ConsultationSummary, VoiceSegment
 from app.models.notification import UserState
+from app.models._ids import new_id
 from app.agents.agent_config import get_voice_agent
+from app.utils.llm_json import extract_json_str, get_agent_content, loads_json
 
 # 로거 설정
 logger = logging.getLogger(__name__)
@@ -60,7 +62,7 @@ async def process_voice_query(state: UserState, config: Dict[str, Any] = None) -
     if not query_text:
         logger.error("쿼리 텍스트를 찾을 수 없음")
         response = VoiceResponse(
-            response_id=str(uuid4()),
+            response_id=new_id(),
             timestamp=datetime.now(),
             query_text="",
             response_text="죄송합니다. 음성 쿼리를 인식할 수 없습니다. 다시 말씀해주세요.",
@@ -118,37 +120,21 @@ async def process_voice_query(state: UserState, config: Dict[str, Any] = None) -
         # 결과 로깅
         logger.info("Gemini API 호출 완료")
         
-        # AIMessage 객체에서 content 추출
-        if hasattr(result, 'content'):
-            output = result.content
-            logger.info(f"Gemini 응답 content 속성 존재")
-        else:
-            output = str(result)
-            logger.info(f"Gemini 응답 content 속성 없음, 결과를 문자열로 변환")
+        # 에이전트 응답에서 텍스트 추출 ({"content": ...} 딕셔너리 또는 AIMessage)
+        output = get_agent_content(result)
         
         # 디버깅을 위해 응답 처음 200자 로깅
         logger.info(f"Gemini 응답 (처음 200자): {output[:200]}...")
         
         # JSON 문자열 추출 및 파싱
-        import json
-        import re
-        
         try:
-            json_match = re.search(r'```json\s*(.*?)\s*```', output, re.DOTALL)
-            if json_match:
-                json_str = json_match.group(1)
-                logger.info("JSON 코드 블록 찾음")
-            else:
-                json_pattern = re.search(r'{.*}', output, re.DOTALL)
-                if json_pattern:
-                    json_str = json_pattern.group(0)
-                    logger.info("중괄호로 둘러싸인 JSON 데이터 찾음")
-                else:
-                    logger.error("JSON 형식의 응답을 찾을 수 없음")
-                    raise ValueError("JSON 형식의 응답을 찾을 수 없습니다.")
+            json_str = extract_json_str(output)
+            if json_str is None:
+                logger.error("JSON 형식의 응답을 찾을 수 없음")
+                raise ValueError("JSON 형식의 응답을 찾을 수 없습니다.")
             
             logger.info(f"파싱할 JSON (처음 100자): {json_str[:100]}...")
-            data = json.loads(json_str)
+            data = loads_json(json_str)
             logger.info(f"JSON 파싱 성공: {list(data.keys())}")
             
             # 반드시 필요한 필드 검증
@@ -159,7 +145,7 @@ async def process_voice_query(state: UserState, config: Dict[str, Any] = None) -
             
             # 응답 생성
             response = VoiceResponse(
-                response_id=str(uuid4()),
+                response_id=new_id(),
                 timestamp=datetime.now(),
                 query_text=query_text,
                 response_text=data["response_text"],
@@ -200,7 +186,7 @@ async def process_voice_query(state: UserState, config: Dict[str, Any] = None) -
             
             # 오류 발생 시 기본 응답 생성
             fallback_response = VoiceResponse(
-                response_id=str(uuid4()),
+                response_id=new_id(),
                 timestamp=datetime.now(),
                 query_text=query_text,
                 response_text="죄송합니다. 응답을 처리하는 중 오류가 발생했습니다. 다시 시도해주세요.",
@@ -226,7 +212,7 @@ async def process_voice_query(state: UserState, config: Dict[str, Any] = None) -
         
         # 오류 발생 시 기본 응답 생성
         fallback_response = VoiceResponse(
-            response_id=str(uuid4()),
+            response_id=new_id(),
             timestamp=datetime.now(),
             query_text=query_text,
             response_text="음성 처리 중 오류가 발생했습니다. 다시 시도해주세요.",
@@ -288,28 +274,16 @@ async def conduct_voice_consultation(state: UserState, config: Dict[str, Any] =
     # 에이전트 실행 및 결과 파싱
     result = await agent.ainvoke({"input": prompt})
     
-    # AIMessage 객체에서 content 추출
-    if hasattr(result, 'content'):
-        output = result.content
-    else:
-        output = str(result)
+    # 에이전트 응답에서 텍스트 추출 ({"content": ...} 딕셔너리 또는 AIMessage)
+    output = get_agent_content(result)
     
     # JSON 문자열 추출 및 파싱
-    import json
-    import re
-    
     try:
-        json_match = re.search(r'```json\s*(.*?)\s*```', output, re.DOTALL)
-        if json_match:
-            json_str = json_match.group(1)
-        else:
-            json_pattern = re.search(r'{.*}', output, re.DOTALL)
-            if json_pattern:
-                json_str = json_pattern.group(0)
-            else:
-                raise ValueError("JSON 형식의 응답을 찾을 수 없습니다.")
+        json_str = extract_json_str(output)
+        if json_str is None:
+            raise ValueError("JSON 형식의 응답을 찾을 수 없습니다.")
         
-        data = json.loads(json_str)
+        data = loads_json(json_str)
         
         # 필수 필드 검증
         required_fields = ["consultation_summary", "key_points", "recommendations"]
@@ -326,7 +300,7 @@ async def conduct_voice_consultation(state: UserState, config: Dict[str, Any] =
         
         # 상담 요약 생성
         summary = ConsultationSummary(
-            consultation_id=str(uuid4()),
+            consultation_id=new_id(),
             timestamp=datetime.now(),
             topic=consultation_topic,
             summary=data["consultation_summary"],
@@ -357,7 +331,7 @@ async def conduct_voice_consultation(state: UserState, config: Dict[str, Any] =
         
         # 오류 발생 시 기본 응답 생성
         fallback_summary = ConsultationSummary(
-            consultation_id=str(uuid4()),
+            consultation_id=new_id(),
             timestamp=datetime.now(),
             topic=consultation_topic,
             summary="상담 처리 중 오류가 발생했습니다. 다시 시도해주세요.",
@@ -396,14 +370,14 @@ async def create_voice_segments(state: UserState, config: Dict[str, Any] = None,
         else:
             logger.warning("last_response 매개변수와 state.last_response 모두 None입니다")
             # 로깅을 위해 상태 객체의 모든 속성 출력
-            logger.debug(f"상태 객체 속성: {dir(state)}")
+            logger.debug("상태 객체 속성: %s", dir(state))
     
     if response is None:
         logger.warning("응답이 없어 기본 메시지를 사용합니다")
         # 기본 응답 생성
         default_text = "죄송합니다. 요청에 대한 응답을 생성할 수 없습니다."
         segments.append(VoiceSegment(
-            segment_id=str(uuid4()),
+            segment_id=new_id(),
             text=default_text,
             duration_seconds=2.0,
             segment_type="error"
@@ -420,7 +394,7 @@ async def create_voice_segments(state: UserState, config: Dict[str, Any] = None,
     # 인사말 세그먼트
     greeting = "안녕하세요, 건강 관리 AI 주치의입니다."
     segments.append(VoiceSegment(
-        segment_id=str(uuid4()),
+        segment_id=new_id(),
         text=greeting,
         duration_seconds=2.0,
         segment_type="greeting"
@@ -429,7 +403,7 @@ async def create_voice_segments(state: UserState, config: Dict[str, Any] = None,
     try:
         # 응답 세그먼트
         segments.append(VoiceSegment(
-            segment_id=str(uuid4()),
+            segment_id=new_id(),
             text=response.response_text,
             duration_seconds=len(response.response_text.split()) * 0.5,  # 단어 수에 따른 대략적인 시간 계산
             segment_type="response"
@@ -438,7 +412,7 @@ async def create_voice_segments(state: UserState, config: Dict[str, Any] = None,
         # 마무리 세그먼트
         closing_text = "추가 질문이 있으신가요?" if response.requires_followup else "오늘 상담은 여기까지입니다. 건강하세요!"
         segments.append(VoiceSegment(
-            segment_id=str(uuid4()),
+            segment_id=new_id(),
             text=closing_text,
             duration_seconds=3.0,
             segment_type="closing"
@@ -469,7 +443,7 @@ async def create_voice_segments(state: UserState, config: Dict[str, Any] = None,
         # 오류 메시지 세그먼트
         error_text = "죄송합니다. 음성 응답을 처리하는 중 오류가 발생했습니다."
         segments.append(VoiceSegment(
-            segment_id=str(uuid4()),
+            segment_id=new_id(),
             text=error_text,
             duration_seconds=2.5,
             segment_type="error"
@@ -0,0 +1,56 @@
+"""
+나이 계산 유틸리티
+사용자 프로필의 생년월일로 프롬프트에 넣을 나이를 계산합니다.
+"""
+
+import functools
+import logging
+import time
+from datetime import date, datetime, timedelta
+from typing import Tuple
+
+logger = logging.getLogger(__name__)
+
+# (오늘 날짜, 다음 날이 시작되는 시각의 timestamp)
+_current_date: Tuple[date, float] = (date.min, 0.0)
+
+def _today() -> date:
+    """오늘 날짜를 반환합니다. 날짜가 바뀔 때만 datetime을 다시 생성합니다."""
+    global _current_date
+    today, next_day_at = _current_date
+    if time.time() >= next_day_at:
+        today = date.today()
+        next_day = datetime.combine(today + timedelta(days=1), datetime.min.time())
+        _current_date = (today, next_day.timestamp())
+    return today
+
+@functools.lru_cache(maxsize=4096)
+def _parse_birth_iso(birth_iso: str) -> Tuple[int, int, int]:
+    """ISO 형식 생년월일 문자열을 (연, 월, 일)로 파싱합니다. (같은 문자열은 다시 파싱하지 않습니다)"""
+    birth_date = datetime.fromisoformat(birth_iso.replace('Z', '+00:00'))
+    return birth_date.year, birth_date.month, birth_date.day
+
+def _birth_ymd(birth_date) -> Tuple[int, int, int]:
+    """생년월일(문자열 또는 date/datetime)을 (연, 월, 일)로 변환합니다."""
+    if isinstance(birth_date, str):
+        # YYYY-MM-DD로 시작하는 일반적인 형식은 datetime 생성 없이 숫자만 읽습니다
+        if (birth_date[:4].isdigit() and birth_date[4:5] == '-'
+                and birth_date[5:7].isdigit() and birth_date[7:8] == '-' and birth_date[8:10].isdigit()):
+            return int(birth_date[:4]), int(birth_date[5:7]), int(birth_date[8:10])
+        return _parse_birth_iso(birth_date)
+
+    return birth_date.year, birth_date.month, birth_date.day
+
+def calculate_age_from_birth_date(birth_date) -> str:
+    """사용자의 생년월일로부터 만 나이를 계산합니다."""
+    if not birth_date:
+        return "정보 없음"
+
+    try:
+        year, month, day = _birth_ymd(birth_date)
+        today = _today()
+        # 올해 생일이 지나지 않았으면 한 살을 뺍니다
+        return str(today.year - year - ((today.month, today.day) < (month, day)))
+    except (TypeError, ValueError, AttributeError) as e:
+        logger.error("나이 계산 오류: %s", e)
+        return "정보 없음"
@@ -202,8 +202,4 @@ class ConversationManager:
                     break
         
         # 결과 변환
-        result = {}
-        for category in entities:
-            result[category] = {"detected": True, "importance": "medium"}
-        
-        return result 
\ No newline at end of file
+        return {category: {"detected": True, "importance": "medium"} for category in entities} 
\ No newline at end of file
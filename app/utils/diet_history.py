@@ -0,0 +1,36 @@
+"""
+식단 이력 유틸리티
+DB에서 조회한 식단 기록을 프롬프트에 넣을 형태로 정리합니다.
+"""
+
+from typing import Any, Dict, Iterable, List
+
+def normalize_diet_history(rows: Iterable[Dict[str, Any]], drop_calories: bool = True) -> List[Dict[str, Any]]:
+    """
+    식단 기록에서 프롬프트에 필요한 필드만 남깁니다.
+
+    날짜 필드는 canonical_json(orjson)이 직접 직렬화하므로 변환하지 않습니다.
+
+    Args:
+        rows: HealthDAO.get_recent_diet_advice_history 조회 결과
+        drop_calories: food_items의 calories 필드 제외 여부
+
+    Returns:
+        List[Dict[str, Any]]: 정리된 식단 이력
+    """
+    history = []
+    for row in rows:
+        food_items = row.get("food_items") or []
+        if drop_calories:
+            # 얕은 복사본에서 calories만 제거 (원본 조회 결과는 변경하지 않음)
+            food_items = [dict(item) for item in food_items]
+            for item in food_items:
+                item.pop("calories", None)
+
+        history.append({
+            "meal_date": row.get("meal_date", ""),
+            "meal_type": row.get("meal_type", ""),
+            "food_items": food_items,
+            "created_at": row.get("created_at", ""),
+        })
+    return history
@@ -0,0 +1,241 @@
+"""
+LLM JSON 유틸리티
+에이전트 응답에서 JSON 객체를 추출하고 파싱하는 공통 로직과
+프롬프트에 넣을 데이터의 정규화 직렬화를 제공합니다.
+"""
+
+import json
+import logging
+import re
+from typing import Any, Dict, Optional
+
+import orjson
+
+logger = logging.getLogger(__name__)
+
+# LLM 응답에서 JSON 객체를 담은 코드 블록을 추출하는 정규식 (```json 또는 언어 표시 없는 ```)
+_JSON_FENCE_RE = re.compile(r'```(?:json)?\s*(\{.*?\})\s*```', re.DOTALL)
+
+# LLM이 JSON 대신 출력하는 파이썬 리터럴
+_PY_LITERALS = {"True": "true", "False": "false", "None": "null"}
+
+def canonical_json(data: Any) -> str:
+    """
+    데이터를 키 정렬, 공백 없는 JSON 문자열로 직렬화합니다.
+
+    같은 데이터는 항상 같은 문자열이 되므로 프롬프트에 넣으면 응답 캐시 키가 안정됩니다.
+    날짜, Decimal 등 JSON 기본 타입이 아닌 값은 문자열로 변환합니다.
+
+    Args:
+        data: 직렬화할 데이터
+
+    Returns:
+        str: 정규화된 JSON 문자열
+    """
+    return orjson.dumps(
+        data,
+        default=str,
+        option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS,
+    ).decode("utf-8")
+
+def get_agent_content(result: Any) -> str:
+    """
+    에이전트 응답에서 텍스트 내용을 꺼냅니다.
+
+    Args:
+        result: 에이전트 응답 ({"content": ...} 딕셔너리 또는 content 속성을 가진 객체)
+
+    Returns:
+        str: 응답 텍스트
+    """
+    if isinstance(result, dict):
+        return result.get("content") or ""
+    if hasattr(result, "content"):
+        return result.content
+    return str(result)
+
+def loads_json(json_str: str) -> Any:
+    """
+    JSON 문자열을 파싱합니다.
+
+    orjson으로 파싱하고, orjson이 거부하는 비표준 JSON(NaN 등)은 표준 json으로 재시도합니다.
+    그래도 실패하면 LLM이 자주 만드는 오류를 repair_json으로 고친 뒤 한 번 더 파싱합니다.
+
+    Args:
+        json_str: JSON 문자열
+
+    Returns:
+        Any: 파싱된 데이터
+
+    Raises:
+        json.JSONDecodeError: 파싱 실패 시 (orjson.JSONDecodeError도 이 예외의 하위 클래스입니다)
+    """
+    try:
+        return orjson.loads(json_str)
+    except orjson.JSONDecodeError:
+        pass
+
+    try:
+        return json.loads(json_str)
+    except json.JSONDecodeError as e:
+        repaired = repair_json(json_str)
+        if repaired == json_str:
+            raise
+        try:
+            return orjson.loads(repaired)
+        except orjson.JSONDecodeError:
+            raise e
+
+def repair_json(json_str: str) -> str:
+    """
+    LLM이 자주 만드는 JSON 오류를 고칩니다.
+
+    문자열 리터럴 밖에서만 다음을 처리합니다.
+    - '}' 또는 ']' 앞의 후행 쉼표 제거
+    - 파이썬 리터럴(True/False/None)을 JSON 리터럴로 변환
+
+    Args:
+        json_str: JSON 문자열
+
+    Returns:
+        str: 수정된 JSON 문자열 (고칠 부분이 없으면 원본과 같은 문자열)
+    """
+    out = []
+    i = 0
+    n = len(json_str)
+    in_string = False
+    escaped = False
+    while i < n:
+        c = json_str[i]
+        if in_string:
+            if escaped:
+                escaped = False
+            elif c == '\\':
+                escaped = True
+            elif c == '"':
+                in_string = False
+        elif c == '"':
+            in_string = True
+        elif c == ',':
+            j = i + 1
+            while j < n and json_str[j].isspace():
+                j += 1
+            if j < n and json_str[j] in '}]':
+                # 후행 쉼표는 건너뜁니다
+                i += 1
+                continue
+        elif c.isalpha():
+            j = i + 1
+            while j < n and (json_str[j].isalnum() or json_str[j] == '_'):
+                j += 1
+            word = json_str[i:j]
+            out.append(_PY_LITERALS.get(word, word))
+            i = j
+            continue
+        out.append(c)
+        i += 1
+    return "".join(out)
+
+def find_braced_json(content: str) -> Optional[str]:
+    """
+    텍스트에서 첫 '{'와 짝이 맞는 '}'까지의 범위를 찾습니다.
+
+    정규식 역추적 없이 한 번만 훑으므로 응답 길이에 비례하는 시간에 끝납니다.
+    문자열 리터럴 안의 중괄호는 깊이 계산에서 제외합니다.
+
+    Args:
+        content: LLM 응답 텍스트
+
+    Returns:
+        Optional[str]: 중괄호로 감싸진 JSON 후보 문자열 (짝이 맞지 않으면 None)
+    """
+    start = content.find('{')
+    if start < 0:
+        return None
+
+    depth = 0
+    in_string = False
+    escaped = False
+    for i in range(start, len(content)):
+        c = content[i]
+        if in_string:
+            if escaped:
+                escaped = False
+            elif c == '\\':
+                escaped = True
+            elif c == '"':
+                in_string = False
+        elif c == '"':
+            in_string = True
+        elif c == '{':
+            depth += 1
+        elif c == '}':
+            depth -= 1
+            if depth == 0:
+                return content[start:i + 1]
+
+    return None
+
+def extract_json_str(content: str) -> Optional[str]:
+    """
+    텍스트에서 JSON 문자열 부분을 찾습니다.
+
+    응답 전체가 중괄호로 감싸져 있으면 그대로 사용하고, 아니면 JSON 객체 코드 블록,
+    첫 '{'와 짝이 맞는 '}'까지의 범위 순으로 찾습니다.
+
+    Args:
+        content: LLM 응답 텍스트
+
+    Returns:
+        Optional[str]: JSON 문자열 (찾지 못한 경우 None)
+    """
+    stripped = content.strip()
+    if stripped.startswith('{') and stripped.endswith('}'):
+        # 순수 JSON 응답은 정규식 탐색 없이 바로 사용
+        return stripped
+
+    fence_match = _JSON_FENCE_RE.search(content)
+    if fence_match:
+        return fence_match.group(1)
+
+    return find_braced_json(content)
+
+def parse_agent_json(result: Any, fallback: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    에이전트 응답에서 JSON 객체를 추출하여 파싱합니다.
+
+    응답 전체가 JSON이면 바로 파싱하고, 아니면 JSON 객체 코드 블록, 중괄호 범위 순으로
+    JSON을 찾습니다. 파싱에 실패하면 fallback의 복사본을 반환합니다.
+
+    Args:
+        result: 에이전트 응답
+        fallback: 파싱 실패 시 반환할 기본 데이터
+
+    Returns:
+        Dict[str, Any]: 파싱된 데이터
+    """
+    content = get_agent_content(result)
+
+    try:
+        # 응답이 순수 JSON인 경우 정규식 탐색 없이 바로 파싱
+        data = orjson.loads(content)
+    except orjson.JSONDecodeError:
+        data = _loads_extracted(content)
+        if data is None:
+            return dict(fallback)
+
+    if not isinstance(data, dict):
+        logger.warning(f"[LLM_JSON] JSON 객체가 아닌 응답: {type(data).__name__}")
+        return dict(fallback)
+
+    return data
+
+def _loads_extracted(content: str) -> Any:
+    """응답 텍스트에서 JSON 부분을 찾아 파싱합니다. 실패하면 None을 반환합니다."""
+    json_str = extract_json_str(content) or content
+
+    try:
+        return loads_json(json_str)
+    except json.JSONDecodeError as e:
+        logger.warning(f"[LLM_JSON] JSON 파싱 실패: {str(e)} - 내용: {json_str[:200]}...")
+        return None
@@ -182,7 +182,7 @@ async def run_voice_query_test(mock=False):
         result = [
             VoiceSegment(
                 segment_id=str(uuid.uuid4()),
-                content="수면 문제와 피로감에 대해 말씀해 주셨네요. 수면의 질을 개선하기 위한 몇 가지 방법을 알려드리겠습니다.",
+                text="수면 문제와 피로감에 대해 말씀해 주셨네요. 수면의 질을 개선하기 위한 몇 가지 방법을 알려드리겠습니다.",
                 segment_type="response",
                 timestamp=datetime.now()
             )
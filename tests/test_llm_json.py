@@ -0,0 +1,118 @@
+import unittest
+import sys
+import os
+
+# 루트 디렉토리 경로 추가
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from app.utils.llm_json import (
+    extract_json_str,
+    find_braced_json,
+    loads_json,
+    parse_agent_json,
+    repair_json,
+)
+
+class TestRepairJson(unittest.TestCase):
+    """LLM JSON 오류 수정 테스트"""
+
+    def test_trailing_commas_in_arrays_and_objects(self):
+        """배열과 객체의 후행 쉼표 제거"""
+        self.assertEqual(repair_json('{"a": [1, 2, ], "b": {"c": 3,},}'), '{"a": [1, 2 ], "b": {"c": 3}}')
+
+    def test_python_literals(self):
+        """파이썬 리터럴을 JSON 리터럴로 변환"""
+        self.assertEqual(repair_json('{"a": True, "b": False, "c": [None]}'), '{"a": true, "b": false, "c": [null]}')
+
+    def test_string_contents_are_untouched(self):
+        """문자열 안의 리터럴, 쉼표, 닫는 괄호는 그대로 유지"""
+        text = '{"a": "True, ]", "b": "None,}", "c": "say \\"True,]\\""}'
+        self.assertEqual(repair_json(text), text)
+
+    def test_valid_json_is_unchanged(self):
+        """고칠 부분이 없으면 같은 문자열 반환"""
+        text = '{"a": [1, 2], "b": true}'
+        self.assertEqual(repair_json(text), text)
+
+class TestLoadsJson(unittest.TestCase):
+    """JSON 파싱 테스트"""
+
+    def test_repairs_llm_errors(self):
+        """후행 쉼표와 파이썬 리터럴이 섞인 JSON 파싱"""
+        self.assertEqual(loads_json('{"a": [1, 2,], "b": True,}'), {"a": [1, 2], "b": True})
+
+    def test_string_with_true_keeps_value(self):
+        """문자열 값의 True는 변환하지 않음"""
+        self.assertEqual(loads_json('{"a": "True", "b": None,}'), {"a": "True", "b": None})
+
+class TestFindBracedJson(unittest.TestCase):
+    """중괄호 범위 탐색 테스트"""
+
+    def test_closing_brace_inside_string(self):
+        """문자열 안의 '}'는 깊이 계산에서 제외"""
+        self.assertEqual(find_braced_json('결과: {"a": "x}y", "b": 1} 끝'), '{"a": "x}y", "b": 1}')
+
+    def test_escaped_quote_inside_string(self):
+        """이스케이프된 따옴표 뒤의 '}'도 문자열로 처리"""
+        text = '{"a": "say \\"}\\"", "b": {"c": 1}}'
+        self.assertEqual(find_braced_json('앞 ' + text + ' 뒤'), text)
+
+    def test_stray_braces_in_prose(self):
+        """객체 앞의 닫는 괄호와 뒤의 괄호는 무시"""
+        self.assertEqual(find_braced_json('} 설명 {"a": {"b": 2}} 그리고 } {'), '{"a": {"b": 2}}')
+
+    def test_unbalanced_or_missing(self):
+        """짝이 맞지 않거나 중괄호가 없으면 None"""
+        self.assertIsNone(find_braced_json('{"a": 1'))
+        self.assertIsNone(find_braced_json('JSON 없음'))
+
+class TestExtractJsonStr(unittest.TestCase):
+    """JSON 문자열 추출 테스트"""
+
+    def test_whole_object_response(self):
+        """응답 전체가 객체이면 그대로 사용"""
+        self.assertEqual(extract_json_str('  {"a": 1}\n'), '{"a": 1}')
+
+    def test_nested_object_in_fence(self):
+        """코드 블록 안의 중첩 객체 전체 추출"""
+        text = '설명입니다.\n```json\n{"a": {"b": {"c": [1, {"d": 2}]}}}\n```\n끝'
+        self.assertEqual(extract_json_str(text), '{"a": {"b": {"c": [1, {"d": 2}]}}}')
+
+    def test_untagged_fence_and_first_block(self):
+        """언어 표시 없는 코드 블록 지원, 여러 블록이면 첫 번째 사용"""
+        text = '```\n{"a": 1}\n```\n다음\n```json\n{"b": 2}\n```'
+        self.assertEqual(extract_json_str(text), '{"a": 1}')
+
+    def test_non_object_fence_falls_back_to_braces(self):
+        """객체가 아닌 코드 블록은 건너뛰고 중괄호 범위 사용"""
+        text = '```python\nprint(1)\n```\n결과: {"a": 1}'
+        self.assertEqual(extract_json_str(text), '{"a": 1}')
+
+    def test_no_json(self):
+        """JSON이 없으면 None"""
+        self.assertIsNone(extract_json_str('일반 텍스트 응답'))
+
+class TestParseAgentJson(unittest.TestCase):
+    """에이전트 응답 JSON 파싱 테스트"""
+
+    FALLBACK = {"service": "diet_advice"}
+
+    def test_content_dict_with_prose(self):
+        """설명이 섞인 응답에서 객체 파싱"""
+        result = {"content": '다음과 같습니다: {"service": "diet_specialist",} 감사합니다'}
+        self.assertEqual(parse_agent_json(result, self.FALLBACK), {"service": "diet_specialist"})
+
+    def test_non_object_json_falls_back(self):
+        """객체가 아닌 JSON은 fallback 복사본 반환"""
+        for content in ('[1, 2, 3]', '"text"', '42'):
+            data = parse_agent_json({"content": content}, self.FALLBACK)
+            self.assertEqual(data, self.FALLBACK)
+            self.assertIsNot(data, self.FALLBACK)
+
+    def test_invalid_json_falls_back(self):
+        """파싱할 수 없는 응답은 fallback 반환"""
+        self.assertEqual(parse_agent_json({"content": '{"service": }'}, self.FALLBACK), self.FALLBACK)
+        self.assertEqual(parse_agent_json({"content": ""}, self.FALLBACK), self.FALLBACK)
+
+if __name__ == "__main__":
+    unittest.main()